@@ -1,8 +1,14 @@
 """Agent Manager - Workflow orchestration for local AI agents."""
 
-from agent_manager.models.agent import Agent, Trigger, TriggerType
-from agent_manager.models.workflow import Job, Workflow, WorkflowDefaults, WorkflowTriggers
-from agent_manager.models.result import JobResult, JobStatus, WorkflowRun, WorkflowStatus
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from agent_manager.models.agent import Agent, Trigger, TriggerType
+    from agent_manager.models.workflow import Job, Workflow, WorkflowDefaults, WorkflowTriggers
+    from agent_manager.models.result import JobResult, JobStatus, WorkflowRun, WorkflowStatus
 
 __all__ = [
     "Agent",
@@ -19,3 +25,32 @@ __all__ = [
 ]
 
 __version__ = "0.2.0"
+
+# The models pull in pydantic and yaml, so they're only imported when first used;
+# `agentctl --help` and `agentctl version` never need them
+_EXPORTS = {
+    "Agent": "agent_manager.models.agent",
+    "Trigger": "agent_manager.models.agent",
+    "TriggerType": "agent_manager.models.agent",
+    "Job": "agent_manager.models.workflow",
+    "Workflow": "agent_manager.models.workflow",
+    "WorkflowDefaults": "agent_manager.models.workflow",
+    "WorkflowTriggers": "agent_manager.models.workflow",
+    "JobResult": "agent_manager.models.result",
+    "JobStatus": "agent_manager.models.result",
+    "WorkflowRun": "agent_manager.models.result",
+    "WorkflowStatus": "agent_manager.models.result",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -3,37 +3,206 @@
 from __future__ import annotations
 
 import asyncio
+import io
 import json
+import os
+import re
+import shlex
 import subprocess
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
 
+from agent_manager.execution.shell_pool import ShellPool, _kill_group
 from agent_manager.expressions.evaluator import ExpressionContext, ExpressionEvaluator
 from agent_manager.expressions.extractor import OutputExtractor
 from agent_manager.models.result import JobResult
-from agent_manager.models.workflow import Job, Workflow
+from agent_manager.models.workflow import Job, ResolvedJobConfig, Workflow
 from agent_manager.providers.base import LLMProvider, ProviderConfig
 from agent_manager.providers.claude_cli import get_claude_cli_provider
 from agent_manager.store.agent_store import get_agent_store
 
+if TYPE_CHECKING:
+    from agent_manager.models.agent import Agent, MCPServer
+
+
+# "# Task i: name" headers that start each job's part of a batched reply
+_BATCH_HEADER_PATTERN = re.compile(r"^#+[ \t]*Task (\d+):[ \t]*(.*?)[ \t\r]*$", re.MULTILINE)
+
+# Context command output beyond this many bytes is dropped from the prompt
+_MAX_CONTEXT_OUTPUT_BYTES = 1024 * 1024
+
+# Context commands containing any of these need the shell to interpret them
+_SHELL_SPECIAL_CHARS = frozenset("|&;<>()$`\\*?[]{}~#!\n")
+# Shell keywords and builtins that have no standalone executable equivalent
+_SHELL_BUILTINS = frozenset({
+    ".", ":", "alias", "case", "cd", "command", "eval", "exec", "exit", "export", "for",
+    "function", "if", "read", "set", "source", "type", "ulimit", "umask", "unset",
+    "until", "while",
+})
+
+
+_SCRATCH_BASE = Path.home() / ".agent-manager" / "scratch"
+
 
 def _get_scratch_base() -> Path:
     """Get the base scratch directory."""
-    return Path.home() / ".agent-manager" / "scratch"
+    return _SCRATCH_BASE
+
+
+@lru_cache(maxsize=128)
+def _expand(path: str) -> Path:
+    """Expand ~ in a configured working directory, once per distinct string."""
+    return Path(path).expanduser()
+
+
+async def _read_bounded(stream: asyncio.StreamReader, limit: int) -> tuple[bytes, bool]:
+    """Read a stream until EOF or until more than limit bytes have arrived.
+
+    Returns the (at most limit) bytes read and whether the output was truncated.
+    """
+    buf = bytearray()
+    while len(buf) <= limit:
+        chunk = await stream.read(limit + 1 - len(buf))
+        if not chunk:
+            return bytes(buf), False
+        buf += chunk
+    return bytes(buf[:limit]), True
+
+
+def _share(total: int | None, n: int, i: int) -> int | None:
+    """Get job i's share of total when splitting it across n jobs."""
+    if total is None:
+        return None
+    return total // n + (1 if i < total % n else 0)
+
+
+def _split_batch_response(response: str, job_names: list[str]) -> list[str]:
+    """Split a batched call's response into each job's own section.
+
+    Sections start at the "# Task i: name" headers the reply is asked to repeat
+    and run to the next such header, whichever task it belongs to. A job whose
+    header appears more than once gets its parts joined; one whose header is
+    missing gets an empty section.
+    """
+    parts: list[list[str]] = [[] for _ in job_names]
+    current: int | None = None
+    start = 0
+    for match in _BATCH_HEADER_PATTERN.finditer(response):
+        i = int(match.group(1)) - 1
+        if not 0 <= i < len(job_names) or match.group(2) != job_names[i]:
+            continue  # Some other heading; it belongs to the current section
+        if current is not None:
+            parts[current].append(response[start : match.start()])
+        current, start = i, match.end()
+    if current is not None:
+        parts[current].append(response[start:])
+
+    sections = []
+    for job_parts in parts:
+        cleaned = (part.strip().removesuffix("---").rstrip() for part in job_parts)
+        sections.append("\n\n".join(part for part in cleaned if part))
+    return sections
+
+
+def _exec_argv(command: str) -> list[str] | None:
+    """Split a context command into argv if it can run without a shell.
+
+    Returns None when the command relies on anything the shell would
+    interpret (pipes, redirects, variables, globs, builtins, env prefixes).
+    """
+    if not _SHELL_SPECIAL_CHARS.isdisjoint(command):
+        return None
+    try:
+        argv = shlex.split(command)
+    except ValueError:
+        return None
+    if not argv or argv[0] in _SHELL_BUILTINS or "=" in argv[0]:
+        return None
+    return argv
+
+
+async def _run_exec(argv: list[str], cwd: Path, limit: int) -> tuple[bytes, bool] | None:
+    """Run a command without a shell and return its bounded output.
+
+    Returns None if the command couldn't be started (e.g. not found), so
+    the caller can let the shell report it as usual.
+    """
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *argv,
+            stdin=subprocess.DEVNULL,  # same as pooled shells: never read our stdin
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            cwd=cwd,
+            start_new_session=True,  # so a runaway command can be killed as a group
+        )
+    except OSError:
+        return None
+
+    assert proc.stdout is not None
+    try:
+        stdout, truncated = await _read_bounded(proc.stdout, limit)
+        if truncated:
+            # Stop a runaway command rather than draining the rest of its output
+            _kill_group(proc)
+        # Discard whatever is left in the pipe so the transport can close
+        await proc.communicate()
+    except BaseException:
+        # Cancelled (e.g. timed out): don't leave the command running
+        _kill_group(proc)
+        await proc.communicate()
+        raise
+    return stdout, truncated
+
+
+class _LoadedAgent(NamedTuple):
+    """An agent together with its resolved integrations."""
+
+    agent: Agent
+    mcp_servers: list[MCPServer]
+    extra_env: dict[str, str]
 
 
 class JobRunner:
     """Runs a single job within a workflow."""
 
-    def __init__(self, provider: LLMProvider | None = None):
+    def __init__(
+        self,
+        provider: LLMProvider | None = None,
+        context_concurrency: int | None = None,
+        context_timeout_s: float | None = 30.0,
+    ):
         """Initialize the job runner.
 
         Args:
             provider: LLM provider to use (defaults to Claude CLI)
+            context_concurrency: Maximum context commands to run at once per job
+                (defaults to four per CPU, capped at 32)
+            context_timeout_s: Seconds a context command may run before it is
+                killed and reported as timed out (None for no limit)
         """
+        if context_concurrency is None:
+            context_concurrency = min(32, (os.cpu_count() or 1) * 4)
+        elif context_concurrency < 1:
+            raise ValueError(f"context_concurrency must be at least 1, got {context_concurrency}")
         self.provider = provider or get_claude_cli_provider()
+        self.context_concurrency = context_concurrency
+        self.context_timeout_s = context_timeout_s
         self.agent_store = get_agent_store()
         self.output_extractor = OutputExtractor()
         self.expression_evaluator = ExpressionEvaluator()
+        # Agent name -> (file mtime_ns, loaded agent); reused while the file is unchanged
+        self._agent_cache: dict[str, tuple[int, _LoadedAgent]] = {}
+        # Shells reused across jobs for context commands that need one
+        self._shell_pool = ShellPool()
+        # Directories this runner has already created (log dirs are shared by a run's jobs)
+        self._created_dirs: set[Path] = set()
+
+    async def close(self) -> None:
+        """Release processes held for reuse across jobs."""
+        await self._shell_pool.close()
 
     async def run(
         self,
@@ -61,39 +230,221 @@ class JobRunner:
         Returns:
             The job result with outputs
         """
+        result = self._start_result(job_name, context, run_id)
+
+        # Evaluate job-level conditional if present
+        if self._apply_condition(job, context, result):
+            return result
+
+        # Handle goals-based jobs (recommended)
+        if job.has_goals:
+            return await self._run_goals(
+                job_name, job, workflow, context, log_directory, dry_run, result, session_ids
+            )
+
+        # Handle single-prompt jobs (agent or inline prompt)
+        return await self._run_single_prompt(
+            job_name, job, workflow, context, log_directory, dry_run, result, session_ids
+        )
+
+    def check_condition(
+        self,
+        job_name: str,
+        job: Job,
+        context: ExpressionContext,
+        run_id: str | None = None,
+    ) -> JobResult | None:
+        """Settle a job whose if_condition keeps it from running, without running it.
+
+        Lets the scheduler finish such jobs without starting a task for them.
+
+        Returns:
+            The skipped (or failed, if the condition is invalid) result, or None
+            if the job has no condition or it evaluates to true
+        """
+        if not job.if_condition:
+            return None
+
+        result = self._start_result(job_name, context, run_id)
+        return result if self._apply_condition(job, context, result) else None
+
+    def _start_result(
+        self,
+        job_name: str,
+        context: ExpressionContext,
+        run_id: str | None,
+    ) -> JobResult:
+        """Create a started result and point the context at the job's scratch directory."""
         result = JobResult(job_name=job_name)
         result.mark_started()
 
         # Create scratch directory for this job
         if run_id:
             output_dir = _get_scratch_base() / run_id / job_name
-            output_dir.mkdir(parents=True, exist_ok=True)
-            result.output_dir = str(output_dir)
+            self._ensure_dir(output_dir)
+            result.output_dir = output_dir
             context.set_current_job(str(output_dir))
         else:
             context.clear_current_job()
 
-        # Evaluate job-level conditional if present
-        if job.if_condition:
-            try:
-                should_run = self.expression_evaluator.evaluate(job.if_condition, context)
-                if not should_run:
-                    result.mark_skipped(f"Condition '{job.if_condition}' evaluated to false")
-                    return result
-            except Exception as e:
-                result.mark_failed(f"Failed to evaluate condition: {e}")
-                return result
+        return result
 
-        # Handle goals-based jobs (recommended)
-        if job.has_goals:
-            return await self._run_goals(
-                job_name, job, workflow, context, log_directory, dry_run, result, session_ids
+    def _apply_condition(self, job: Job, context: ExpressionContext, result: JobResult) -> bool:
+        """Evaluate the job's if_condition, finishing the result if the job shouldn't run.
+
+        Returns:
+            True if the result was marked skipped or failed
+        """
+        if not job.if_condition:
+            return False
+
+        try:
+            should_run = self.expression_evaluator.evaluate(job.if_condition, context)
+            if not should_run:
+                result.mark_skipped(f"Condition '{job.if_condition}' evaluated to false")
+                return True
+        except Exception as e:
+            result.mark_failed(f"Failed to evaluate condition: {e}")
+            return True
+
+        return False
+
+    def _ensure_dir(self, path: Path) -> None:
+        """Create a directory unless this runner already has."""
+        if path not in self._created_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(path)
+
+    @staticmethod
+    def can_batch(job: Job) -> bool:
+        """Check if a job may share a provider call with other jobs.
+
+        Only plain goals-based jobs qualify: agents bring their own integrations,
+        and conditions and session continuation need a call of their own.
+        """
+        return (
+            job.has_goals
+            and job.agent is None
+            and job.if_condition is None
+            and job.continue_session is None
+        )
+
+    async def run_batch(
+        self,
+        jobs: list[tuple[str, Job]],
+        workflow: Workflow,
+        context: ExpressionContext,
+        log_directory: Path,
+        run_id: str | None = None,
+    ) -> list[JobResult]:
+        """Run several independent goals-based jobs with a single provider call.
+
+        All jobs must pass can_batch() and resolve to the same config. Each job
+        keeps its own context, goals and scratch directory; outputs are read
+        back per job from its own outputs.json.
+
+        Args:
+            jobs: (job name, job definition) pairs to run together
+            workflow: The parent workflow
+            context: The expression evaluation context
+            log_directory: Directory to store job logs
+            run_id: The workflow run ID (for scratch directories)
+
+        Returns:
+            One job result per job, in the order given
+        """
+        resolved = workflow.resolve_job_config(jobs[0][0])
+        working_dir = _expand(resolved.working_directory)
+
+        # The jobs share one call, so they share its start and (on failure) end times
+        started = datetime.now()
+        results: list[JobResult] = []
+        for job_name, _job in jobs:
+            result = JobResult(job_name=job_name)
+            result.mark_started(when=started)
+            if run_id:
+                output_dir = _get_scratch_base() / run_id / job_name
+                self._ensure_dir(output_dir)
+                result.output_dir = output_dir
+            results.append(result)
+
+        # Gather context for every job at once
+        with_context = [i for i, (_, job) in enumerate(jobs) if job.context]
+        gathered = await asyncio.gather(
+            *(self._gather_context_parallel(jobs[i][1].context, working_dir) for i in with_context)
+        )
+        context_results: list[dict[str, str]] = [{} for _ in jobs]
+        for i, job_context in zip(with_context, gathered):
+            context_results[i] = job_context
+
+        # Build one section per job, each interpolated against its own scratch dir
+        sections: list[str] = []
+        for (job_name, job), result, job_context in zip(jobs, results, context_results):
+            if result.output_dir:
+                context.set_current_job(str(result.output_dir))
+            else:
+                context.clear_current_job()
+            sections.append(
+                self._build_goals_prompt(
+                    job, job_context, result.output_dir, context, job.all_outputs
+                )
             )
+        prompt = self._build_batch_prompt([name for name, _ in jobs], sections)
 
-        # Handle single-prompt jobs (agent or inline prompt)
-        return await self._run_single_prompt(
-            job_name, job, workflow, context, log_directory, dry_run, result, session_ids
+        all_outputs = [output for _, job in jobs for output in job.all_outputs]
+        config = self._build_goals_config(
+            jobs[0][1], resolved, working_dir, all_outputs, results[0].output_dir
         )
+        # The combined call has to cover every job's share of turns and budget
+        config.max_turns = resolved.max_turns * len(jobs)
+        config.max_budget_usd = resolved.max_budget_usd * len(jobs)
+
+        self._ensure_dir(log_directory)
+        log_file = log_directory / f"{jobs[0][0]}.batch.log"
+
+        response = await self.provider.execute(prompt, config, log_file)
+
+        if not response.success:
+            finished = datetime.now()
+            for result in results:
+                result.mark_failed(response.error or "Unknown error", when=finished)
+            return results
+
+        # Each job only keeps (and has outputs scanned from) its own part of the reply
+        replies = _split_batch_response(response.result, [name for name, _ in jobs])
+
+        # Split stats evenly so workflow totals still add up
+        n = len(jobs)
+        for i, ((_, job), result, reply) in enumerate(zip(jobs, results, replies)):
+            result.update_stats(
+                input_tokens=_share(response.input_tokens, n, i),
+                output_tokens=_share(response.output_tokens, n, i),
+                cost=response.cost / n if response.cost is not None else None,
+            )
+            result.log_file = str(log_file)
+            result.session_id = response.session_id
+
+            outputs = job.all_outputs
+            if outputs:
+                extracted = await self._extract_outputs(reply, outputs, result.output_dir)
+                result.mark_completed(outputs=extracted, claude_output=reply)
+            else:
+                result.mark_completed(claude_output=reply)
+
+        return results
+
+    @staticmethod
+    def _build_batch_prompt(job_names: list[str], sections: list[str]) -> str:
+        """Combine per-job prompt sections into a single multi-task prompt."""
+        buf = io.StringIO()
+        write = buf.write
+        write(f"You have {len(sections)} independent tasks to complete. ")
+        write("Work through each one in order; each task has its own context, ")
+        write("goals and required outputs. Start your reply for each task with ")
+        write('its header line, e.g. "# Task 1: name".\n\n')
+        for i, (name, section) in enumerate(zip(job_names, sections), 1):
+            write(f"# Task {i}: {name}\n\n{section}\n---\n\n")
+        return buf.getvalue()
 
     async def _run_single_prompt(
         self,
@@ -121,7 +472,7 @@ class JobRunner:
             return result
 
         # Execute via provider
-        log_directory.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(log_directory)
         log_file = log_directory / f"{job_name}.log"
 
         # Determine session_id for continuation
@@ -147,7 +498,7 @@ class JobRunner:
         # Extract outputs - try file first, then regex fallback
         outputs = job.outputs or []
         if outputs:
-            extracted = self._extract_outputs(response.result, outputs, result.output_dir)
+            extracted = await self._extract_outputs(response.result, outputs, result.output_dir)
             result.mark_completed(outputs=extracted, claude_output=response.result)
         else:
             result.mark_completed(claude_output=response.result)
@@ -173,60 +524,33 @@ class JobRunner:
         3. Make one Claude call
         4. Extract report outputs
         """
-        working_dir = Path(workflow.working_directory(job_name)).expanduser()
+        resolved = workflow.resolve_job_config(job_name)
+        working_dir = _expand(resolved.working_directory)
 
-        # Step 1: Gather context by running shell commands IN PARALLEL
+        outputs = job.all_outputs
+
+        # Step 1: Gather context by running shell commands IN PARALLEL.
+        # Config prep doesn't depend on context, so it runs in a worker thread meanwhile.
         context_results: dict[str, str] = {}
-        if job.context:
-            if dry_run:
+        if job.context and not dry_run:
+            context_results, config = await asyncio.gather(
+                self._gather_context_parallel(job.context, working_dir),
+                asyncio.to_thread(
+                    self._build_goals_config, job, resolved, working_dir, outputs, result.output_dir
+                ),
+            )
+        else:
+            if job.context:
                 context_results = {
                     name: f"[DRY RUN] Would run: {cmd}" for name, cmd in job.context.items()
                 }
-            else:
-                context_results = await self._gather_context_parallel(job.context, working_dir)
+            config = self._build_goals_config(
+                job, resolved, working_dir, outputs, result.output_dir
+            )
 
         # Step 2: Build prompt from context + goals
-        prompt = self._build_goals_prompt(job, context_results, result.output_dir, context)
-
-        # Add output instructions if report fields are declared
-        outputs = job.all_outputs
-        if outputs:
-            prompt += self._build_output_instructions(outputs, result.output_dir)
-
-        # Resolve agent integrations if job references an agent
-        from agent_manager.models.agent import MCPServer
-        mcp_servers: list[MCPServer] = []
-        extra_env: dict[str, str] = {}
-
-        if job.agent:
-            try:
-                agent = self.agent_store.load(job.agent)
-                if agent.integrations:
-                    if agent.integrations.mcp_servers:
-                        mcp_servers = agent.integrations.mcp_servers
-                    if agent.integrations.env:
-                        for env_var in agent.integrations.env:
-                            value = env_var.resolve()
-                            if value is not None:
-                                extra_env[env_var.name] = value
-            except Exception:
-                pass  # Agent loading is best-effort for goals-based jobs
-
-        # Build allowed tools list - add Write if file-based outputs are needed
-        allowed_tools = list(workflow.allowed_tools(job_name))
-        if result.output_dir and outputs and "Write" not in allowed_tools:
-            allowed_tools.append("Write")
-
-        # Build config
-        config = ProviderConfig(
-            working_directory=working_dir,
-            allowed_tools=allowed_tools,
-            max_turns=workflow.max_turns(job_name),
-            max_budget_usd=workflow.max_budget(job_name),
-            permission_mode=workflow.permission_mode(job_name),
-            model=workflow.model(job_name),
-            mcp_servers=mcp_servers,
-            extra_env=extra_env,
+        prompt = self._build_goals_prompt(
+            job, context_results, result.output_dir, context, outputs
         )
 
         # Dry run - don't execute
@@ -236,7 +560,7 @@ class JobRunner:
             return result
 
         # Step 3: Execute via provider (single Claude call)
-        log_directory.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(log_directory)
         log_file = log_directory / f"{job_name}.log"
 
         # Determine session_id for continuation
@@ -261,60 +585,105 @@ class JobRunner:
 
         # Step 4: Extract report outputs - try file first, then regex fallback
         if outputs:
-            extracted = self._extract_outputs(response.result, outputs, result.output_dir)
+            extracted = await self._extract_outputs(response.result, outputs, result.output_dir)
             result.mark_completed(outputs=extracted, claude_output=response.result)
         else:
             result.mark_completed(claude_output=response.result)
 
         return result
 
+    def _build_goals_config(
+        self,
+        job: Job,
+        resolved: ResolvedJobConfig,
+        working_dir: Path,
+        outputs: list[str],
+        output_dir: Path | None,
+    ) -> ProviderConfig:
+        """Build the provider config for a goals-based job."""
+        # Resolve agent integrations if job references an agent
+        mcp_servers: list[MCPServer] = []
+        extra_env: dict[str, str] = {}
+
+        if job.agent:
+            try:
+                loaded = self._load_agent(job.agent)
+                mcp_servers = loaded.mcp_servers
+                extra_env = loaded.extra_env
+            except Exception:
+                pass  # Agent loading is best-effort for goals-based jobs
+
+        # Build allowed tools list - add Write if file-based outputs are needed
+        allowed_tools = list(resolved.allowed_tools)
+        if output_dir and outputs and "Write" not in allowed_tools:
+            allowed_tools.append("Write")
+
+        return ProviderConfig(
+            working_directory=working_dir,
+            allowed_tools=allowed_tools,
+            max_turns=resolved.max_turns,
+            max_budget_usd=resolved.max_budget_usd,
+            permission_mode=resolved.permission_mode,
+            model=resolved.model,
+            mcp_servers=mcp_servers,
+            extra_env=extra_env,
+        )
+
     def _build_goals_prompt(
         self,
         job: Job,
         context_results: dict[str, str],
-        output_dir: str | None = None,
+        output_dir: Path | None = None,
         expr_context: ExpressionContext | None = None,
+        outputs: list[str] | None = None,
     ) -> str:
-        """Build a prompt from goals and gathered context."""
-        parts: list[str] = []
+        """Build a prompt from goals and gathered context.
+
+        Output instructions for outputs, if any, are rendered into the same prompt.
+        """
+        goals = job.goals or []
+        if expr_context:
+            goals = [self.expression_evaluator.interpolate(g, expr_context) for g in goals]
+
+        buf = io.StringIO()
+        write = buf.write
 
         # Add context section if any context was gathered
         if context_results:
-            parts.append("## Current Context\n")
+            write("## Current Context\n\n")
             for name, output in context_results.items():
-                parts.append(f"### {name}\n```\n{output}\n```\n")
+                write(f"### {name}\n```\n{output}\n```\n\n")
 
         # Add output directory info if available
         if output_dir:
-            parts.append("## Output Directory\n")
-            parts.append(f"Your scratch directory for this job is: `{output_dir}`\n")
-            parts.append("Use this directory for any files you need to create.\n\n")
-
-        # Add goals section - interpolate all ${{ }} expressions
-        parts.append("## Goals\n")
-        parts.append("Accomplish the following goals:\n")
-        for i, goal in enumerate(job.goals or [], 1):
-            interpolated_goal = goal
-            if expr_context:
-                interpolated_goal = self.expression_evaluator.interpolate(
-                    interpolated_goal, expr_context
-                )
-            parts.append(f"{i}. {interpolated_goal}\n")
+            write("## Output Directory\n\n")
+            write(f"Your scratch directory for this job is: `{output_dir}`\n\n")
+            write("Use this directory for any files you need to create.\n\n\n")
 
-        parts.append("\nUse your judgment on how best to achieve these goals. ")
-        parts.append("You have full autonomy to determine the approach.\n")
+        # Add goals section
+        write("## Goals\n\n")
+        write("Accomplish the following goals:\n\n")
+        for i, goal in enumerate(goals, 1):
+            write(f"{i}. {goal}\n\n")
 
-        return "\n".join(parts)
+        write("\nUse your judgment on how best to achieve these goals. \n")
+        write("You have full autonomy to determine the approach.\n")
 
-    def _build_output_instructions(self, outputs: list[str], output_dir: str | None) -> str:
-        """Build instructions for structured outputs.
+        # Add output instructions if report fields are declared
+        if outputs:
+            write(self._render_output_instructions(outputs, output_dir))
+
+        return buf.getvalue()
+
+    def _render_output_instructions(self, outputs: list[str], output_dir: Path | None) -> str:
+        """Render instructions for structured outputs.
 
         If output_dir is available, instructs Claude to write outputs.json.
         Otherwise, uses the standard regex-based output format.
         """
         if output_dir:
             # File-based output instructions
-            output_file = Path(output_dir) / "outputs.json"
+            output_file = output_dir / "outputs.json"
             lines = [
                 "\n## Required Outputs\n",
                 "After completing the goals, write your outputs to a JSON file.\n\n",
@@ -333,20 +702,19 @@ class JobRunner:
             # Fall back to regex-based output instructions
             return OutputExtractor.output_instructions(outputs)
 
-    def _extract_outputs(
-        self, response: str, output_keys: list[str], output_dir: str | None
+    async def _extract_outputs(
+        self, response: str, output_keys: list[str], output_dir: Path | None
     ) -> dict[str, str]:
         """Extract outputs, trying file-based first then regex fallback."""
         if output_dir:
-            output_file = Path(output_dir) / "outputs.json"
-            if output_file.exists():
-                try:
-                    with output_file.open() as f:
-                        data = json.load(f)
-                    # Convert all values to strings
-                    return {k: str(v) for k, v in data.items() if k in output_keys}
-                except (json.JSONDecodeError, OSError):
-                    pass  # Fall through to regex extraction
+            output_file = output_dir / "outputs.json"
+            try:
+                # Read off the event loop so concurrent jobs aren't stalled by slow disks
+                data = json.loads(await asyncio.to_thread(output_file.read_bytes))
+                # Convert all values to strings
+                return {k: str(v) for k, v in data.items() if k in output_keys}
+            except (ValueError, OSError):
+                pass  # Missing or unreadable file: fall through to regex extraction
 
         # Regex fallback
         return self.output_extractor.extract(response, output_keys)
@@ -355,27 +723,39 @@ class JobRunner:
         self, context_commands: dict[str, str], working_dir: Path
     ) -> dict[str, str]:
         """Gather context by running shell commands in parallel."""
+        semaphore = asyncio.Semaphore(self.context_concurrency)
+        limit = _MAX_CONTEXT_OUTPUT_BYTES
+
+        async def spawn_and_read(command: str) -> tuple[bytes, bool]:
+            # Plain commands skip the shell; the rest reuse a pooled one
+            argv = _exec_argv(command)
+            ran = await _run_exec(argv, working_dir, limit) if argv else None
+            if ran is None:
+                ran = await self._shell_pool.run(command, working_dir, limit)
+            return ran
 
         async def run_command(name: str, command: str) -> tuple[str, str]:
-            try:
-                proc = await asyncio.create_subprocess_shell(
-                    command,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                    cwd=working_dir,
-                )
-                stdout, _ = await proc.communicate()
-                output = stdout.decode("utf-8", errors="replace").strip()
-                return name, output if output else "(no output)"
-            except Exception as e:
-                return name, f"(error: {e})"
+            async with semaphore:
+                try:
+                    # The timeout starts once a slot is free, not while queued
+                    stdout, truncated = await asyncio.wait_for(
+                        spawn_and_read(command), self.context_timeout_s
+                    )
+                    output = stdout.decode("utf-8", errors="replace").strip()
+                    if truncated:
+                        output += "\n... (truncated)"
+                    return name, output if output else "(no output)"
+                except asyncio.TimeoutError:
+                    return name, "(timeout)"
+                except Exception as e:
+                    return name, f"(error: {e})"
 
         # Run all context commands in parallel
         tasks = [run_command(name, cmd) for name, cmd in context_commands.items()]
         results = await asyncio.gather(*tasks)
 
-        # Preserve original order from context_commands
-        return {name: dict(results)[name] for name in context_commands}
+        # gather() returns results in submission order, which is context_commands order
+        return dict(results)
 
     def run_sync(
         self,
@@ -389,9 +769,16 @@ class JobRunner:
         session_ids: dict[str, str] | None = None,
     ) -> JobResult:
         """Synchronous version of run."""
-        return asyncio.run(
-            self.run(job_name, job, workflow, context, log_directory, dry_run, run_id, session_ids)
-        )
+
+        async def run_and_close() -> JobResult:
+            try:
+                return await self.run(
+                    job_name, job, workflow, context, log_directory, dry_run, run_id, session_ids
+                )
+            finally:
+                await self.close()
+
+        return asyncio.run(run_and_close())
 
     def _build_prompt_and_config(
         self,
@@ -401,34 +788,28 @@ class JobRunner:
         context: ExpressionContext,
     ) -> tuple[str, ProviderConfig]:
         """Build the prompt and provider config for a job."""
+        resolved = workflow.resolve_job_config(job_name)
+
         # Get base prompt from agent or inline
-        from agent_manager.models.agent import MCPServer
         mcp_servers: list[MCPServer] = []
         extra_env: dict[str, str] = {}
 
         if job.agent:
-            agent = self.agent_store.load(job.agent)
+            loaded = self._load_agent(job.agent)
+            agent = loaded.agent
             base_prompt = agent.prompt
             allowed_tools = job.allowed_tools or agent.allowed_tools
             max_turns = job.max_turns or agent.max_turns
             max_budget = job.max_budget_usd or agent.max_budget_usd
             working_dir = job.working_directory or agent.working_directory
-
-            # Resolve agent integrations
-            if agent.integrations:
-                if agent.integrations.mcp_servers:
-                    mcp_servers = agent.integrations.mcp_servers
-                if agent.integrations.env:
-                    for env_var in agent.integrations.env:
-                        value = env_var.resolve()
-                        if value is not None:
-                            extra_env[env_var.name] = value
+            mcp_servers = loaded.mcp_servers
+            extra_env = loaded.extra_env
         elif job.prompt:
             base_prompt = job.prompt
-            allowed_tools = workflow.allowed_tools(job_name)
-            max_turns = workflow.max_turns(job_name)
-            max_budget = workflow.max_budget(job_name)
-            working_dir = workflow.working_directory(job_name)
+            allowed_tools = list(resolved.allowed_tools)
+            max_turns = resolved.max_turns
+            max_budget = resolved.max_budget_usd
+            working_dir = resolved.working_directory
         else:
             raise ValueError(f"Job '{job_name}' has neither 'agent' nor 'prompt' defined")
 
@@ -443,18 +824,54 @@ class JobRunner:
 
         # Build config
         config = ProviderConfig(
-            working_directory=Path(working_dir).expanduser(),
+            working_directory=_expand(working_dir),
             allowed_tools=allowed_tools,
             max_turns=max_turns,
             max_budget_usd=max_budget,
-            permission_mode=workflow.permission_mode(job_name),
-            model=workflow.model(job_name),
+            permission_mode=resolved.permission_mode,
+            model=resolved.model,
             mcp_servers=mcp_servers,
             extra_env=extra_env,
         )
 
         return final_prompt, config
 
+    def _load_agent(self, name: str) -> _LoadedAgent:
+        """Load an agent and resolve its integrations, reusing the result while unchanged.
+
+        The cache entry is keyed on the agent file's mtime, so edits to the agent
+        YAML are picked up on the next job that references it.
+        """
+        try:
+            mtime_ns = self.agent_store.agent_path(name).stat().st_mtime_ns
+        except OSError:
+            mtime_ns = None
+
+        cached = self._agent_cache.get(name)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        agent = self.agent_store.load(name)
+        mcp_servers: list[MCPServer] = []
+        extra_env: dict[str, str] = {}
+
+        if agent.integrations:
+            if agent.integrations.mcp_servers:
+                mcp_servers = agent.integrations.mcp_servers
+            if agent.integrations.env:
+                # One plain-dict snapshot instead of an os.environ lookup per variable
+                environ = os.environ.copy()
+                extra_env = {
+                    env_var.name: value
+                    for env_var in agent.integrations.env
+                    if (value := env_var.resolve(environ)) is not None
+                }
+
+        loaded = _LoadedAgent(agent, mcp_servers, extra_env)
+        if mtime_ns is not None:
+            self._agent_cache[name] = (mtime_ns, loaded)
+        return loaded
+
 
 # Default instance
 _runner: JobRunner | None = None
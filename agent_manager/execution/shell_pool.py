@@ -0,0 +1,148 @@
+"""Pool of long-lived shells for running context commands."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import shlex
+import signal
+import subprocess
+from pathlib import Path
+from uuid import uuid4
+
+
+class ShellPool:
+    """Reuses ``sh`` processes so context commands don't each start a new shell.
+
+    Idle shells are kept per working directory. Each command is passed as a
+    single quoted argument to ``eval`` in a subshell of an idle shell, with
+    stdin from /dev/null, so ``cd``/``export`` can't leak into later commands,
+    nothing can read the command stream, and a malformed command (an
+    unterminated quote or heredoc) fails on its own instead of swallowing what
+    follows it. Its end is marked by a unique sentinel line. A shell that exits
+    or produces runaway output is killed and not reused.
+    """
+
+    def __init__(self, max_idle_per_directory: int = 4):
+        """Initialize the pool.
+
+        Args:
+            max_idle_per_directory: Maximum idle shells to keep per working directory
+        """
+        self.max_idle_per_directory = max_idle_per_directory
+        self._idle: dict[Path, list[asyncio.subprocess.Process]] = {}
+        # Shells turned away by a full pool, told to exit but not yet awaited
+        self._retired: list[asyncio.subprocess.Process] = []
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    async def run(self, command: str, cwd: Path, limit: int) -> tuple[bytes, bool]:
+        """Run a shell command and return its combined output.
+
+        Args:
+            command: The shell command to run
+            cwd: Working directory for the command
+            limit: Maximum number of output bytes to keep
+
+        Returns:
+            The output (at most limit bytes) and whether it was truncated
+        """
+        proc = self._acquire(cwd) or await self._spawn(cwd)
+        assert proc.stdin is not None and proc.stdout is not None
+
+        sentinel = f"__agent_manager_done_{uuid4().hex}__".encode()
+        marker = b"\n" + sentinel + b"\n"
+        proc.stdin.write(
+            b"( eval " + shlex.quote(command).encode() + b" ) </dev/null 2>&1\n"
+            b"printf '\\n%s\\n' " + sentinel + b"\n"
+        )
+
+        buf = bytearray()
+        try:
+            await proc.stdin.drain()
+            while True:
+                end = buf.find(marker)
+                if end != -1:
+                    output = bytes(buf[:end])
+                    self._release(cwd, proc)
+                    return output, False
+                if len(buf) > limit + len(marker):
+                    # Runaway output: stop the command along with its shell
+                    await self._discard(proc)
+                    return bytes(buf[:limit]), True
+                chunk = await proc.stdout.read(65536)
+                if not chunk:
+                    # The shell itself exited (e.g. it was killed)
+                    await self._discard(proc)
+                    return bytes(buf[:limit]), len(buf) > limit
+                buf += chunk
+        except BaseException:
+            await self._discard(proc)
+            raise
+
+    async def close(self) -> None:
+        """Shut down all idle shells and wait for every shell told to exit."""
+        idle = [proc for procs in self._idle.values() for proc in procs]
+        self._idle.clear()
+        for proc in idle:
+            assert proc.stdin is not None
+            proc.stdin.close()
+        idle += self._retired
+        self._retired = []
+        for proc in idle:
+            await proc.communicate()
+
+    def _acquire(self, cwd: Path) -> asyncio.subprocess.Process | None:
+        """Take an idle shell for cwd, if there is one."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Shells belong to the loop that started them; never reuse them elsewhere.
+            # They can't be awaited from this loop, so just kill them.
+            for proc in [p for procs in self._idle.values() for p in procs] + self._retired:
+                _kill_group(proc)
+            self._idle.clear()
+            self._retired = []
+            self._loop = loop
+
+        idle = self._idle.get(cwd)
+        while idle:
+            proc = idle.pop()
+            if proc.returncode is None:
+                return proc
+        return None
+
+    def _release(self, cwd: Path, proc: asyncio.subprocess.Process) -> None:
+        """Return a shell to the idle pool, or close it if the pool is full."""
+        idle = self._idle.setdefault(cwd, [])
+        if len(idle) < self.max_idle_per_directory:
+            idle.append(proc)
+        else:
+            assert proc.stdin is not None
+            proc.stdin.close()
+            # Keep it until close() awaits it, dropping any that have already exited
+            self._retired = [p for p in self._retired if p.returncode is None]
+            self._retired.append(proc)
+
+    async def _spawn(self, cwd: Path) -> asyncio.subprocess.Process:
+        """Start a new shell in cwd."""
+        return await asyncio.create_subprocess_exec(
+            "/bin/sh",
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            cwd=cwd,
+            start_new_session=True,  # so the shell and its commands can be killed as a group
+        )
+
+    async def _discard(self, proc: asyncio.subprocess.Process) -> None:
+        """Kill a shell and everything it started."""
+        _kill_group(proc)
+        # Discard whatever is left in the pipe so the transport can close
+        await proc.communicate()
+
+
+def _kill_group(proc: asyncio.subprocess.Process) -> None:
+    """SIGKILL a process started in its own session, along with its children."""
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
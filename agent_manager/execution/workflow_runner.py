@@ -4,12 +4,13 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Callable
+from datetime import datetime
 from typing import TYPE_CHECKING
 
 from agent_manager.execution.job_runner import JobRunner, get_job_runner
 from agent_manager.expressions.evaluator import ExpressionContext
-from agent_manager.models.result import JobStatus, WorkflowRun, WorkflowStatus
-from agent_manager.models.workflow import Workflow
+from agent_manager.models.result import JobResult, JobStatus, WorkflowRun, WorkflowStatus
+from agent_manager.models.workflow import ResolvedJobConfig, Workflow
 from agent_manager.store.workflow_store import WorkflowStore, get_workflow_store
 
 if TYPE_CHECKING:
@@ -27,6 +28,7 @@ class WorkflowRunner:
         store: WorkflowStore | None = None,
         job_runner: JobRunner | None = None,
         max_concurrent_jobs: int = 4,
+        save_interval_s: float = 1.0,
     ):
         """Initialize the workflow runner.
 
@@ -34,10 +36,12 @@ class WorkflowRunner:
             store: Workflow store (defaults to singleton)
             job_runner: Job runner (defaults to singleton)
             max_concurrent_jobs: Maximum jobs to run in parallel
+            save_interval_s: Minimum time between saves of an in-progress run
         """
         self.store = store or get_workflow_store()
         self.job_runner = job_runner or get_job_runner()
         self.max_concurrent_jobs = max_concurrent_jobs
+        self.save_interval_s = save_interval_s
 
     async def run(
         self,
@@ -50,7 +54,7 @@ class WorkflowRunner:
 
         Args:
             workflow: The workflow to execute
-            dry_run: If true, don't actually execute Claude
+            dry_run: If true, don't actually execute Claude or save the run
             single_job: If set, only run this specific job
             status_callback: Optional callback for job status updates
 
@@ -67,7 +71,7 @@ class WorkflowRunner:
         run.mark_started()
 
         # Save initial state
-        self.store.save_run(run)
+        self._save_run(run)
 
         try:
             if single_job:
@@ -80,22 +84,31 @@ class WorkflowRunner:
                 )
 
             # Determine final status
-            if run.failed_job_count > 0:
-                run.mark_failed(f"{run.failed_job_count} job(s) failed")
+            failed_count = run.failed_job_count
+            if failed_count > 0:
+                run.mark_failed(f"{failed_count} job(s) failed")
             else:
                 run.mark_completed()
 
         except Exception as e:
             run.mark_failed(str(e))
+        finally:
+            await self.job_runner.close()
 
         # Save final state
-        self.store.save_run(run)
+        self._save_run(run)
 
         # Prune old runs
-        self.store.prune_runs(workflow.name)
+        if not dry_run:
+            self.store.prune_runs(workflow.name)
 
         return run
 
+    def _save_run(self, run: WorkflowRun) -> None:
+        """Persist a run; dry runs are kept in memory only."""
+        if not run.is_dry_run:
+            self.store.save_run(run)
+
     async def _run_single_job(
         self,
         workflow: Workflow,
@@ -153,108 +166,206 @@ class WorkflowRunner:
         context = ExpressionContext()
         log_dir = self.store.run_log_directory(workflow.name, run.id)
 
-        pending = set(workflow.jobs.keys())
-        running_tasks: dict[str, asyncio.Task[tuple[str, JobStatus]]] = {}
-        semaphore = asyncio.Semaphore(self.max_concurrent_jobs)
+        jobs = workflow.jobs
+        pending = set(jobs)
+        running_tasks: set[asyncio.Task[list[tuple[str, JobStatus]]]] = set()
+        # Dry runs report each job on its own
+        batch_size = None if dry_run else workflow.batch_size
 
         # Track session IDs for session continuation
         session_ids: dict[str, str] = {}
 
-        async def run_job(job_name: str) -> tuple[str, JobStatus]:
-            """Run a single job and return its name and status."""
-            async with semaphore:
-                job = workflow.jobs[job_name]
+        # Finished jobs mark the run dirty and a background task saves it, so a
+        # burst of short jobs doesn't rewrite the run file once per job
+        dirty = asyncio.Event()
 
-                if status_callback:
-                    status_callback(job_name, JobStatus.RUNNING)
+        async def flush_saves() -> None:
+            """Save the run whenever it changes, at most once per save interval."""
+            while True:
+                await dirty.wait()
+                dirty.clear()
+                self._save_run(run)
+                await asyncio.sleep(self.save_interval_s)
 
-                result = await self.job_runner.run(
-                    job_name=job_name,
-                    job=job,
-                    workflow=workflow,
-                    context=context,
-                    log_directory=log_dir,
-                    dry_run=dry_run,
-                    run_id=run.id,
-                    session_ids=session_ids,
-                )
+        def record(result: JobResult) -> None:
+            """Publish a finished job's outputs and status."""
+            context.set_outputs(result.job_name, result.outputs)
+            context.set_status(result.job_name, result.status.value)
 
-                # Update context with outputs
-                context.set_outputs(job_name, result.outputs)
-                context.set_status(job_name, result.status.value)
-
-                # Track session ID for continuation
-                if result.session_id:
-                    session_ids[job_name] = result.session_id
-
-                run.update_job_result(result)
-                self.store.save_run(run)
-
-                if status_callback:
-                    status_callback(job_name, result.status)
-
-                return job_name, result.status
-
-        # Process jobs until all are done
-        while pending or running_tasks:
-            # Find ready jobs
-            ready = [
-                name for name in pending
-                if self._job_is_ready(name, workflow, run)
-            ]
-
-            # Start ready jobs
-            for job_name in ready:
-                pending.remove(job_name)
-                task = asyncio.create_task(run_job(job_name))
-                running_tasks[job_name] = task
-
-            if not running_tasks and pending:
-                # Deadlock - skip remaining jobs
-                for job_name in pending:
-                    result = run.job_results[job_name]
-                    result.mark_skipped("Dependencies not satisfied")
-                    run.update_job_result(result)
-                break
+            # Track session ID for continuation
+            if result.session_id:
+                session_ids[result.job_name] = result.session_id
 
-            # Wait for at least one job to complete
-            if running_tasks:
-                done, _ = await asyncio.wait(
-                    running_tasks.values(), return_when=asyncio.FIRST_COMPLETED
-                )
+            run.update_job_result(result)
+
+            if status_callback:
+                status_callback(result.job_name, result.status)
 
-                for task in done:
-                    job_name, status = task.result()
-                    del running_tasks[job_name]
+        async def run_job(job_name: str) -> list[tuple[str, JobStatus]]:
+            """Run a single job and return its name and status."""
+            job = jobs[job_name]
+
+            if status_callback:
+                status_callback(job_name, JobStatus.RUNNING)
+
+            result = await self.job_runner.run(
+                job_name=job_name,
+                job=job,
+                workflow=workflow,
+                context=context,
+                log_directory=log_dir,
+                dry_run=dry_run,
+                run_id=run.id,
+                session_ids=session_ids,
+            )
+
+            record(result)
+            dirty.set()
+
+            return [(job_name, result.status)]
+
+        async def run_batch(job_names: list[str]) -> list[tuple[str, JobStatus]]:
+            """Run a group of jobs in one provider call and return their statuses."""
+            if status_callback:
+                for job_name in job_names:
+                    status_callback(job_name, JobStatus.RUNNING)
 
-                    # If job failed, skip dependents
-                    if status == JobStatus.FAILED:
-                        self._skip_dependents(job_name, workflow, run, pending)
+            results = await self.job_runner.run_batch(
+                jobs=[(job_name, jobs[job_name]) for job_name in job_names],
+                workflow=workflow,
+                context=context,
+                log_directory=log_dir,
+                run_id=run.id,
+            )
+
+            for result in results:
+                record(result)
+            dirty.set()
+
+            return [(result.job_name, result.status) for result in results]
+
+        # Count each job's unfinished dependencies; it's ready when the count hits zero
+        remaining = {name: len(set(job.needs or ())) for name, job in jobs.items()}
+        ready = [name for name, count in remaining.items() if count == 0]
+        # Ready jobs that are cleared to run but still waiting for a free slot
+        waiting: list[str] = []
+
+        # Start jobs with the longest chain of work behind them first, so the
+        # critical path isn't held up by leaf jobs when all slots are busy
+        chain_lengths = workflow.critical_path_lengths()
+
+        def settle(job_name: str, status: JobStatus) -> None:
+            """Release or skip the dependents of a finished job."""
+            if status in (JobStatus.COMPLETED, JobStatus.SKIPPED):
+                # Release dependents whose last dependency this was
+                for dep in workflow.dependents(job_name):
+                    remaining[dep] -= 1
+                    if remaining[dep] == 0:
+                        ready.append(dep)
+            elif status == JobStatus.FAILED:
+                # If job failed, skip dependents
+                self._skip_dependents(job_name, workflow, run, pending)
+
+        flusher = asyncio.create_task(flush_saves())
+        try:
+            # Process jobs until all are done
+            while pending or running_tasks:
+                # Settle jobs whose if_condition is false without starting a task.
+                # Settling appends newly released jobs to ready, and this loop
+                # picks them up too.
+                for job_name in ready:
+                    if job_name not in pending:
+                        continue
+                    job = jobs[job_name]
+                    result = (
+                        self.job_runner.check_condition(job_name, job, context, run.id)
+                        if job.if_condition
+                        else None
+                    )
+                    if result is None:
+                        waiting.append(job_name)
+                        continue
+                    pending.discard(job_name)
+                    record(result)
+                    dirty.set()
+                    settle(job_name, result.status)
+                ready.clear()
+
+                # Start waiting jobs while there are free slots, combining compatible
+                # ones when batching is enabled; the rest wait for the next pass
+                waiting.sort(key=lambda name: (-chain_lengths[name], name))
+                rank = {name: i for i, name in enumerate(waiting)}
+                plan = self._plan_batches(waiting, workflow, batch_size)
+                plan.sort(key=lambda group: rank[group[0]])
+
+                waiting = []
+                for group in plan:
+                    if len(running_tasks) >= self.max_concurrent_jobs:
+                        waiting.extend(group)
+                        continue
+                    pending.difference_update(group)
+                    if len(group) == 1:
+                        running_tasks.add(asyncio.create_task(run_job(group[0])))
+                    else:
+                        running_tasks.add(asyncio.create_task(run_batch(group)))
+
+                if not running_tasks and pending:
+                    # Deadlock - skip remaining jobs
+                    now = datetime.now()
+                    for job_name in pending:
+                        result = run.job_results[job_name]
+                        result.mark_skipped("Dependencies not satisfied", when=now)
+                        run.update_job_result(result)
+                    break
+
+                # Wait for at least one job to complete
+                if running_tasks:
+                    done, _ = await asyncio.wait(
+                        running_tasks, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    running_tasks -= done
+
+                    for task in done:
+                        for job_name, status in task.result():
+                            settle(job_name, status)
+        finally:
+            # The caller saves the final state; surface any error from a save here
+            flusher.cancel()
+            try:
+                await flusher
+            except asyncio.CancelledError:
+                pass
 
         return run
 
-    def _job_is_ready(
+    def _plan_batches(
         self,
-        job_name: str,
+        ready: list[str],
         workflow: Workflow,
-        run: WorkflowRun,
-    ) -> bool:
-        """Check if a job is ready to run (all dependencies completed)."""
-        job = workflow.jobs.get(job_name)
-        if not job:
-            return False
+        batch_size: int | None,
+    ) -> list[list[str]]:
+        """Group ready jobs that can share one provider call.
 
-        if not job.needs:
-            return True
+        Jobs are grouped when JobRunner.can_batch() allows it and their
+        resolved config is identical, in groups of at most batch_size.
+        Everything else runs on its own.
+        """
+        if not batch_size or batch_size < 2:
+            return [[job_name] for job_name in ready]
+
+        plan: list[list[str]] = []
+        groups: dict[ResolvedJobConfig, list[str]] = {}
+        for job_name in ready:
+            if JobRunner.can_batch(workflow.jobs[job_name]):
+                groups.setdefault(workflow.resolve_job_config(job_name), []).append(job_name)
+            else:
+                plan.append([job_name])
 
-        for dep in job.needs:
-            dep_result = run.job_results.get(dep)
-            if not dep_result:
-                return False
-            if dep_result.status not in (JobStatus.COMPLETED, JobStatus.SKIPPED):
-                return False
+        for job_names in groups.values():
+            for i in range(0, len(job_names), batch_size):
+                plan.append(job_names[i : i + batch_size])
 
-        return True
+        return plan
 
     def _skip_dependents(
         self,
@@ -263,18 +374,25 @@ class WorkflowRunner:
         run: WorkflowRun,
         pending: set[str],
     ) -> None:
-        """Skip jobs that depend on a failed job."""
-        dependents = workflow.dependents(failed_job)
-
-        for dep in dependents:
-            if dep in pending:
-                result = run.job_results[dep]
-                result.mark_skipped(f"Dependency '{failed_job}' failed")
-                run.update_job_result(result)
-                pending.discard(dep)
-
-                # Recursively skip dependents
-                self._skip_dependents(dep, workflow, run, pending)
+        """Skip jobs that depend on a failed job, and everything downstream of them."""
+        # Depth-first with an explicit stack, so deep chains can't hit the recursion limit
+        stack = [(failed_job, iter(workflow.dependents(failed_job)))]
+        now = datetime.now()  # one timestamp for the whole cascade
+
+        while stack:
+            parent, children = stack[-1]
+            for dep in children:
+                if dep in pending:
+                    result = run.job_results[dep]
+                    result.mark_skipped(f"Dependency '{parent}' failed", when=now)
+                    run.update_job_result(result)
+                    pending.discard(dep)
+
+                    # Skip this job's dependents before moving on to its siblings
+                    stack.append((dep, iter(workflow.dependents(dep))))
+                    break
+            else:
+                stack.pop()
 
     def run_sync(
         self,
@@ -3,7 +3,23 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Callable
 from dataclasses import dataclass, field
+from functools import lru_cache
+
+_INTERPOLATION_PATTERN = re.compile(r"\$\{\{\s*([^}]+)\s*\}\}")
+
+
+@lru_cache(maxsize=256)
+def _split_template(text: str) -> tuple[str, ...]:
+    """Split text into alternating literal text and stripped ${{ }} expressions.
+
+    Even indexes are literals and odd indexes are expressions, so text with no
+    expressions comes back as a single literal.
+    """
+    pieces = _INTERPOLATION_PATTERN.split(text)
+    pieces[1::2] = [expr.strip() for expr in pieces[1::2]]
+    return tuple(pieces)
 
 
 class ExpressionError(Exception):
@@ -65,37 +81,48 @@ class ExpressionContext:
 
     def resolve(self, path: str) -> str | None:
         """Resolve a variable path like 'jobs.lint.outputs.has_errors'."""
-        parts = path.split(".")
+        field_name, name, key = _classify_path(path)
+        value = getattr(self, field_name).get(name)
+        if key is None:
+            return value
+        return value.get(key) if value is not None else None
 
-        # Handle job.X pattern (current job context, e.g., job.output_dir)
-        if len(parts) == 2 and parts[0] == "job":
-            key = parts[1]
-            return self.current_job.get(key)
 
-        # Handle jobs.X.outputs.Y pattern
-        if len(parts) == 4 and parts[0] == "jobs" and parts[2] == "outputs":
-            job_name = parts[1]
-            output_name = parts[3]
-            return self.job_outputs.get(job_name, {}).get(output_name)
+@lru_cache(maxsize=1024)
+def _classify_path(path: str) -> tuple[str, str, str | None]:
+    """Map a variable path to the context field it reads and the keys to look up.
 
-        # Handle jobs.X.status pattern
-        if len(parts) == 3 and parts[0] == "jobs" and parts[2] == "status":
-            job_name = parts[1]
-            return self.job_statuses.get(job_name)
+    Returns (field, name, key): the value is field[name], or field[name][key]
+    when key is given.
+    """
+    parts = path.split(".")
+
+    # Handle job.X pattern (current job context, e.g., job.output_dir)
+    if len(parts) == 2 and parts[0] == "job":
+        return "current_job", parts[1], None
 
+    if len(parts) == 4 and parts[2] == "outputs":
+        # Handle jobs.X.outputs.Y pattern
+        if parts[0] == "jobs":
+            return "job_outputs", parts[1], parts[3]
         # Handle steps.X.outputs.Y pattern (for within-job step references)
-        if len(parts) == 4 and parts[0] == "steps" and parts[2] == "outputs":
-            step_name = parts[1]
-            output_name = parts[3]
-            return self.step_outputs.get(step_name, {}).get(output_name)
+        if parts[0] == "steps":
+            return "step_outputs", parts[1], parts[3]
 
+    if len(parts) == 3 and parts[2] == "status":
+        # Handle jobs.X.status pattern
+        if parts[0] == "jobs":
+            return "job_statuses", parts[1], None
         # Handle steps.X.status pattern
-        if len(parts) == 3 and parts[0] == "steps" and parts[2] == "status":
-            step_name = parts[1]
-            return self.step_statuses.get(step_name)
+        if parts[0] == "steps":
+            return "step_statuses", parts[1], None
+
+    # Handle simple variable
+    return "variables", path, None
 
-        # Handle simple variable
-        return self.variables.get(path)
+
+# A compiled expression, evaluated against a context without re-parsing
+_Predicate = Callable[[ExpressionContext], bool]
 
 
 class ExpressionEvaluator:
@@ -107,8 +134,16 @@ class ExpressionEvaluator:
     - Logical operators: &&, ||, !
     - Functions: success(), failure(), always(), cancelled()
     - String literals: 'value' or "value"
+
+    Expressions are parsed once into predicates over a context, and the
+    compiled form is cached by expression string.
     """
 
+    def __init__(self) -> None:
+        self._compile: Callable[[str], _Predicate] = lru_cache(maxsize=512)(
+            self._compile_logical_or
+        )
+
     def evaluate(self, expression: str, context: ExpressionContext) -> bool:
         """Evaluate an expression string and return boolean result."""
         expr = self._extract_expression(expression)
@@ -116,7 +151,7 @@ class ExpressionEvaluator:
         if not expr:
             return True  # Empty expression defaults to true
 
-        return self._evaluate_logical_or(expr, context)
+        return self._compile(expr)(context)
 
     def evaluate_to_string(self, expression: str, context: ExpressionContext) -> str:
         """Evaluate an expression and return its string value."""
@@ -131,18 +166,24 @@ class ExpressionEvaluator:
             return value
 
         # Otherwise evaluate as expression and return string
-        result = self._evaluate_logical_or(expr, context)
+        result = self._compile(expr)(context)
         return "true" if result else "false"
 
     def interpolate(self, text: str, context: ExpressionContext) -> str:
         """Interpolate expressions in a string, replacing ${{ ... }} with values."""
-        pattern = r"\$\{\{\s*([^}]+)\s*\}\}"
+        # Most prompts and commands have no expressions; checking for "$" is a memchr
+        if "$" not in text:
+            return text
 
-        def replace(match: re.Match[str]) -> str:
-            expr = match.group(1).strip()
-            return self.evaluate_to_string(expr, context)
+        # Templates are scanned once; later calls only evaluate the expressions
+        pieces = _split_template(text)
+        if len(pieces) == 1:
+            return text
 
-        return re.sub(pattern, replace, text)
+        values = list(pieces)
+        for i in range(1, len(values), 2):
+            values[i] = self.evaluate_to_string(values[i], context)
+        return "".join(values)
 
     def _extract_expression(self, expression: str) -> str:
         """Extract the expression from ${{ ... }} wrapper."""
@@ -154,100 +195,116 @@ class ExpressionEvaluator:
 
         return expr.strip()
 
-    def _evaluate_logical_or(self, expression: str, context: ExpressionContext) -> bool:
-        """Evaluate || expressions."""
+    def _compile_logical_or(self, expression: str) -> _Predicate:
+        """Compile || expressions."""
         parts = self._split_by_operator(expression, "||")
 
         if len(parts) > 1:
-            return any(self._evaluate_logical_and(p.strip(), context) for p in parts)
+            preds = tuple(self._compile_logical_and(p.strip()) for p in parts)
+
+            # A plain loop short-circuits without any()'s per-call generator
+            def logical_or(context: ExpressionContext) -> bool:
+                for pred in preds:
+                    if pred(context):
+                        return True
+                return False
 
-        return self._evaluate_logical_and(expression, context)
+            return logical_or
 
-    def _evaluate_logical_and(self, expression: str, context: ExpressionContext) -> bool:
-        """Evaluate && expressions."""
+        return self._compile_logical_and(expression)
+
+    def _compile_logical_and(self, expression: str) -> _Predicate:
+        """Compile && expressions."""
         parts = self._split_by_operator(expression, "&&")
 
         if len(parts) > 1:
-            return all(self._evaluate_comparison(p.strip(), context) for p in parts)
+            preds = tuple(self._compile_comparison(p.strip()) for p in parts)
+
+            def logical_and(context: ExpressionContext) -> bool:
+                for pred in preds:
+                    if not pred(context):
+                        return False
+                return True
+
+            return logical_and
 
-        return self._evaluate_comparison(expression, context)
+        return self._compile_comparison(expression)
 
-    def _evaluate_comparison(self, expression: str, context: ExpressionContext) -> bool:
-        """Evaluate comparison expressions."""
+    def _compile_comparison(self, expression: str) -> _Predicate:
+        """Compile comparison expressions."""
         operators = ["==", "!=", "<=", ">=", "<", ">"]
 
         for op in operators:
             if op in expression:
                 idx = expression.find(op)
-                left = expression[:idx].strip()
-                right = expression[idx + len(op):].strip()
+                left = self._compile_value(expression[:idx].strip())
+                right = self._compile_value(expression[idx + len(op):].strip())
+                compare = self._compare
 
-                left_value = self._resolve_value(left, context)
-                right_value = self._resolve_value(right, context)
-
-                return self._compare(left_value, op, right_value)
+                return lambda context: compare(left(context), op, right(context))
 
         # Handle negation
         if expression.startswith("!"):
-            inner = expression[1:].strip()
-            return not self._evaluate_primary(inner, context)
+            inner = self._compile_primary(expression[1:].strip())
+            return lambda context: not inner(context)
 
-        return self._evaluate_primary(expression, context)
+        return self._compile_primary(expression)
 
-    def _evaluate_primary(self, expression: str, context: ExpressionContext) -> bool:
-        """Evaluate primary expressions (literals, variables, functions)."""
+    def _compile_primary(self, expression: str) -> _Predicate:
+        """Compile primary expressions (literals, variables, functions)."""
         expr = expression.strip()
 
         # Handle parentheses
         if expr.startswith("(") and expr.endswith(")"):
-            return self._evaluate_logical_or(expr[1:-1], context)
+            return self._compile_logical_or(expr[1:-1])
 
         # Handle boolean literals
         if expr.lower() == "true":
-            return True
+            return lambda context: True
         if expr.lower() == "false":
-            return False
+            return lambda context: False
 
         # Handle built-in functions
         if expr == "success()":
-            return all(
+            return lambda context: all(
                 s in ("completed", "skipped")
                 for s in context.job_statuses.values()
             )
 
         if expr == "failure()":
-            return any(s == "failed" for s in context.job_statuses.values())
+            return lambda context: any(s == "failed" for s in context.job_statuses.values())
 
         if expr == "always()":
-            return True
+            return lambda context: True
 
         if expr == "cancelled()":
-            return any(s == "cancelled" for s in context.job_statuses.values())
+            return lambda context: any(s == "cancelled" for s in context.job_statuses.values())
 
-        # Handle variable reference - truthy check
-        value = context.resolve(expr)
-        if value is not None:
-            return self._is_truthy(value)
+        # Handle variable reference - truthy check; unknown expressions are false
+        is_truthy = self._is_truthy
 
-        # Unknown expression - default to false
-        return False
+        def variable(context: ExpressionContext) -> bool:
+            value = context.resolve(expr)
+            return value is not None and is_truthy(value)
+
+        return variable
 
-    def _resolve_value(self, value: str, context: ExpressionContext) -> str:
-        """Resolve a value (variable or literal)."""
+    def _compile_value(self, value: str) -> Callable[[ExpressionContext], str]:
+        """Compile a value (variable or literal)."""
         value = value.strip()
 
         # Handle quoted strings
         if (value.startswith("'") and value.endswith("'")) or \
            (value.startswith('"') and value.endswith('"')):
-            return value[1:-1]
+            literal = value[1:-1]
+            return lambda context: literal
 
-        # Handle variable reference
-        resolved = context.resolve(value)
-        if resolved is not None:
-            return resolved
+        def resolve(context: ExpressionContext) -> str:
+            # Handle variable reference, otherwise return as literal
+            resolved = context.resolve(value)
+            return resolved if resolved is not None else value
 
-        # Return as literal
-        return value
+        return resolve
 
     def _compare(self, left: str, op: str, right: str) -> bool:
         """Compare two values with an operator."""
@@ -289,9 +346,15 @@ class ExpressionEvaluator:
 
     def _split_by_operator(self, expression: str, operator: str) -> list[str]:
         """Split expression by operator, respecting quotes."""
-        parts: list[str] = []
-        current = ""
+        if "'" not in expression and '"' not in expression:
+            parts = expression.split(operator)
+            if not parts[-1]:
+                parts.pop()
+            return parts
+
+        parts = []
         in_quote: str | None = None
+        start = 0
         i = 0
 
         while i < len(expression):
@@ -303,21 +366,19 @@ class ExpressionEvaluator:
                     in_quote = None
                 elif in_quote is None:
                     in_quote = char
-                current += char
                 i += 1
                 continue
 
             # Check for operator (only if not in quotes)
-            if in_quote is None and expression[i:].startswith(operator):
-                parts.append(current)
-                current = ""
+            if in_quote is None and expression.startswith(operator, i):
+                parts.append(expression[start:i])
                 i += len(operator)
+                start = i
                 continue
 
-            current += char
             i += 1
 
-        if current:
-            parts.append(current)
+        if start < len(expression):
+            parts.append(expression[start:])
 
         return parts
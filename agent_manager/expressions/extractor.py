@@ -4,6 +4,105 @@ from __future__ import annotations
 
 import json
 import re
+from functools import lru_cache
+from typing import Any, NamedTuple
+
+# Prefer RE2 (the optional "re2" extra) for extraction: it matches in linear time,
+# so adversarial model output can't trigger catastrophic backtracking.
+try:
+    import re2 as _regex  # type: ignore[import]
+except ImportError:
+    _regex = re
+
+# re.Pattern[str], or RE2's equivalent when it's installed
+_Pattern = Any
+
+# Everything re's \s matches in a str pattern. RE2's \s is ASCII-only (and skips \v),
+# so the patterns spell the class out to match the same text under both engines.
+_WS = "[\t\n\v\f\r\x1c-\x1f \x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000]"
+
+# Fenced ```json blocks, then bare objects with an "outputs" key, each paired
+# with a character it can't match without. Single-character `in` is a memchr,
+# so responses without that character skip the regex scan.
+_JSON_BLOCK_PATTERNS = (
+    ("`", _regex.compile(rf'(?s)```json{_WS}*\n(.*?)\n```')),
+    ("{", _regex.compile(r'(?s)\{[^{}]*"outputs"[^{}]*\}')),
+)
+
+
+# Non-ASCII characters that re or RE2 match case-insensitively against an ASCII letter
+# (dotted/dotless I, long s, Kelvin sign)
+_ASCII_CASE_VARIANTS = str.maketrans({"\u0130": "i", "\u0131": "i", "\u017f": "s", "\u212a": "k"})
+
+
+def _fold(text: str) -> str:
+    """Lowercase text so that any case-insensitive match of an ASCII name is a substring."""
+    if not text.isascii():
+        text = text.translate(_ASCII_CASE_VARIANTS)
+    return text.lower()
+
+
+class _OutputPatterns(NamedTuple):
+    """Precompiled extraction patterns for a single output name."""
+
+    structured: _Pattern
+    tagged: _Pattern
+    key_value: tuple[_Pattern, ...]
+    inline: tuple[_Pattern, ...]
+
+
+@lru_cache(maxsize=512)
+def _patterns_for(name: str) -> _OutputPatterns:
+    """Compile the extraction patterns for an output name once and reuse them.
+
+    Flags are written inline so the same patterns work with both re and RE2.
+    """
+    n = re.escape(name)
+    return _OutputPatterns(
+        structured=_regex.compile(
+            rf'(?is)<output{_WS}+name{_WS}*={_WS}*["\']?{n}["\']?{_WS}*>(.*?)</output>'
+        ),
+        tagged=_regex.compile(rf'(?is)<{n}>(.*?)</{n}>'),
+        key_value=tuple(
+            _regex.compile(p)
+            for p in (
+                # **key**: value
+                rf'(?i)\*\*{n}\*\*{_WS}*:{_WS}*(.+?)(?:\n|$)',
+                # key: value (at start of line)
+                rf'(?i)(?:^|\n){n}{_WS}*:{_WS}*(.+?)(?:\n|$)',
+                # - key: value
+                rf'(?i)[-•]{_WS}*{n}{_WS}*:{_WS}*(.+?)(?:\n|$)',
+            )
+        ),
+        inline=tuple(
+            _regex.compile(p)
+            for p in (
+                # the name is value
+                rf'(?i)the{_WS}+{n}{_WS}+is{_WS}+[`"\']?(.+?)[`"\']?(?:\.|,|\n|$)',
+                # name = value
+                rf'(?i){n}{_WS}*={_WS}*[`"\']?(.+?)[`"\']?(?:\.|,|\n|$)',
+                # name: `value`
+                rf'(?i){n}:{_WS}*`(.+?)`',
+            )
+        ),
+    )
+
+
+@lru_cache(maxsize=256)
+def _render_output_instructions(outputs: tuple[str, ...]) -> str:
+    """Render the output format instructions for a given set of outputs."""
+    output_tags = "\n".join(f"<{o}>your value here</{o}>" for o in outputs)
+    output_list = "\n".join(f"- {o}" for o in outputs)
+
+    return f"""
+
+IMPORTANT: At the end of your response, provide the following outputs in this exact format:
+
+{output_tags}
+
+Required outputs:
+{output_list}
+"""
 
 
 class OutputExtractor:
@@ -27,9 +126,14 @@ class OutputExtractor:
             return {}
 
         results: dict[str, str] = {}
+        # Every strategy needs the name to appear in the response, so one folded
+        # copy of it lets absent outputs skip all of their patterns
+        folded = _fold(response)
 
         # Try multiple extraction strategies
         for output in declared_outputs:
+            if output.isascii() and output.lower() not in folded:
+                continue
             value = (
                 self._extract_structured_output(output, response)
                 or self._extract_tagged_output(output, response)
@@ -43,33 +147,22 @@ class OutputExtractor:
 
     def _extract_structured_output(self, name: str, response: str) -> str | None:
         """Extract output from structured format like <output name="key">value</output>."""
-        pattern = rf'<output\s+name\s*=\s*["\']?{re.escape(name)}["\']?\s*>(.*?)</output>'
-        match = re.search(pattern, response, re.IGNORECASE | re.DOTALL)
+        match = _patterns_for(name).structured.search(response)
         if match:
             return match.group(1).strip()
         return None
 
     def _extract_tagged_output(self, name: str, response: str) -> str | None:
         """Extract output from simple tagged format like <key>value</key>."""
-        pattern = rf'<{re.escape(name)}>(.*?)</{re.escape(name)}>'
-        match = re.search(pattern, response, re.IGNORECASE | re.DOTALL)
+        match = _patterns_for(name).tagged.search(response)
         if match:
             return match.group(1).strip()
         return None
 
     def _extract_key_value_output(self, name: str, response: str) -> str | None:
         """Extract output from key-value format like 'key: value' or '**key**: value'."""
-        patterns = [
-            # **key**: value
-            rf'\*\*{re.escape(name)}\*\*\s*:\s*(.+?)(?:\n|$)',
-            # key: value (at start of line)
-            rf'(?:^|\n){re.escape(name)}\s*:\s*(.+?)(?:\n|$)',
-            # - key: value
-            rf'[-•]\s*{re.escape(name)}\s*:\s*(.+?)(?:\n|$)',
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, response, re.IGNORECASE)
+        for pattern in _patterns_for(name).key_value:
+            match = pattern.search(response)
             if match:
                 value = match.group(1).strip()
                 if value:
@@ -79,17 +172,8 @@ class OutputExtractor:
 
     def _extract_inline_output(self, name: str, response: str) -> str | None:
         """Extract output from inline mentions like 'the result is X'."""
-        patterns = [
-            # the name is value
-            rf'the\s+{re.escape(name)}\s+is\s+[`"\']?(.+?)[`"\']?(?:\.|,|\n|$)',
-            # name = value
-            rf'{re.escape(name)}\s*=\s*[`"\']?(.+?)[`"\']?(?:\.|,|\n|$)',
-            # name: `value`
-            rf'{re.escape(name)}:\s*`(.+?)`',
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, response, re.IGNORECASE)
+        for pattern in _patterns_for(name).inline:
+            match = pattern.search(response)
             if match:
                 value = match.group(1).strip()
                 # Sanity check on length
@@ -101,13 +185,10 @@ class OutputExtractor:
     def extract_from_json(self, response: str) -> dict[str, str] | None:
         """Extract all outputs from a JSON block in the response."""
         # Look for JSON blocks
-        patterns = [
-            r'```json\s*\n(.*?)\n```',
-            r'\{[^{}]*"outputs"[^{}]*\}',
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, response, re.DOTALL)
+        for required, pattern in _JSON_BLOCK_PATTERNS:
+            if required not in response:
+                continue
+            match = pattern.search(response)
             if not match:
                 continue
 
@@ -136,16 +217,4 @@ class OutputExtractor:
         """Generate prompt text instructing Claude how to format outputs."""
         if not outputs:
             return ""
-
-        output_tags = "\n".join(f"<{o}>your value here</{o}>" for o in outputs)
-        output_list = "\n".join(f"- {o}" for o in outputs)
-
-        return f"""
-
-IMPORTANT: At the end of your response, provide the following outputs in this exact format:
-
-{output_tags}
-
-Required outputs:
-{output_list}
-"""
+        return _render_output_instructions(tuple(outputs))
@@ -3,13 +3,25 @@
 from __future__ import annotations
 
 import os
+from collections.abc import Mapping
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 
 import yaml
 from pydantic import BaseModel, Field, model_validator
 from typing_extensions import Self
 
+# libyaml's C loader/dumper when PyYAML was built with it; same safe subset, much faster
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_SafeDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+@lru_cache(maxsize=128)
+def _expand_working_directory(path: str) -> Path:
+    """Expand ~ in a working directory, once per distinct string."""
+    return Path(path).expanduser()
+
 
 class TriggerType(str, Enum):
     """Type of trigger for an agent."""
@@ -70,12 +82,16 @@ class EnvVar(BaseModel):
             )
         return self
 
-    def resolve(self) -> str | None:
-        """Resolve the environment variable value."""
+    def resolve(self, environ: Mapping[str, str] | None = None) -> str | None:
+        """Resolve the environment variable value.
+
+        Args:
+            environ: Environment to read from_env values from (defaults to os.environ)
+        """
         if self.value is not None:
             return self.value
         if self.from_env is not None:
-            return os.environ.get(self.from_env)
+            return (os.environ if environ is None else environ).get(self.from_env)
         if self.from_file is not None:
             path = Path(self.from_file).expanduser()
             if path.exists():
@@ -106,34 +122,42 @@ class Agent(BaseModel):
     max_budget_usd: float = Field(default=1.0, alias="max_budget_usd")
     integrations: Integration | None = None  # MCP servers and env vars
 
+    # Frozen: stores hand out shared cached instances, so fields are never reassigned
     model_config = {
         "populate_by_name": True,
         "extra": "forbid",
+        "frozen": True,
     }
 
     @property
     def expanded_working_directory(self) -> Path:
         """Expand ~ in working directory to full path."""
-        return Path(self.working_directory).expanduser()
+        return _expand_working_directory(self.working_directory)
 
     @classmethod
     def load(cls, path: Path | str) -> Self:
         """Load an agent from a YAML file."""
-        path = Path(path)
-        with path.open() as f:
-            data = yaml.safe_load(f)
+        # One read of the raw bytes; libyaml decodes UTF-8 (or a BOM'd UTF-16) itself
+        data = yaml.load(Path(path).read_bytes(), Loader=_SafeLoader)
         return cls.model_validate(data)
 
     @classmethod
     def from_yaml(cls, content: str) -> Self:
         """Parse an agent from YAML string."""
-        data = yaml.safe_load(content)
+        data = yaml.load(content, Loader=_SafeLoader)
         return cls.model_validate(data)
 
     def to_yaml(self) -> str:
         """Serialize agent to YAML string."""
-        data = self.model_dump(by_alias=True, exclude_none=True)
-        return yaml.dump(data, default_flow_style=False, sort_keys=False, allow_unicode=True)
+        # JSON mode turns enums into plain strings, which the safe dumper can represent
+        data = self.model_dump(mode="json", by_alias=True, exclude_none=True)
+        return yaml.dump(
+            data,
+            Dumper=_SafeDumper,
+            default_flow_style=False,
+            sort_keys=False,
+            allow_unicode=True,
+        )
 
     def save(self, path: Path | str) -> None:
         """Save agent to a YAML file."""
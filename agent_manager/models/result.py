@@ -5,10 +5,10 @@ from __future__ import annotations
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
 from uuid import uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 if TYPE_CHECKING:
     from agent_manager.models.workflow import Workflow
@@ -35,6 +35,24 @@ class JobStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
+_STATUS_ICONS = {
+    JobStatus.PENDING: "○",
+    JobStatus.RUNNING: "◐",
+    JobStatus.COMPLETED: "●",
+    JobStatus.FAILED: "✗",
+    JobStatus.SKIPPED: "⊘",
+    JobStatus.CANCELLED: "◌",
+}
+
+
+_FINISHED_JOB_STATUSES = frozenset({
+    JobStatus.COMPLETED,
+    JobStatus.FAILED,
+    JobStatus.SKIPPED,
+    JobStatus.CANCELLED,
+})
+
+
 class JobResult(BaseModel):
     """Result of a single job execution."""
 
@@ -49,7 +67,7 @@ class JobResult(BaseModel):
     error_message: str | None = Field(default=None, alias="error_message")
     log_file: str | None = Field(default=None, alias="log_file")
     claude_output: str | None = Field(default=None, alias="claude_output")
-    output_dir: str | None = Field(default=None, alias="output_dir")
+    output_dir: Path | None = Field(default=None, alias="output_dir")
     session_id: str | None = Field(default=None, alias="session_id")
 
     model_config = {"populate_by_name": True}
@@ -71,53 +89,49 @@ class JobResult(BaseModel):
     @property
     def is_finished(self) -> bool:
         """Check if the job has completed (successfully or with failure)."""
-        return self.status in (
-            JobStatus.COMPLETED,
-            JobStatus.FAILED,
-            JobStatus.SKIPPED,
-            JobStatus.CANCELLED,
-        )
+        return self.status in _FINISHED_JOB_STATUSES
 
     @property
     def is_successful(self) -> bool:
         """Check if the job was successful."""
-        return self.status == JobStatus.COMPLETED
+        return self.status is JobStatus.COMPLETED
 
-    def mark_started(self) -> None:
+    def mark_started(self, when: datetime | None = None) -> None:
         """Mark the job as started."""
         self.status = JobStatus.RUNNING
-        self.start_time = datetime.now()
+        self.start_time = when or datetime.now()
 
     def mark_completed(
         self,
         outputs: dict[str, str] | None = None,
         claude_output: str | None = None,
+        when: datetime | None = None,
     ) -> None:
         """Mark the job as completed with outputs."""
         self.status = JobStatus.COMPLETED
-        self.end_time = datetime.now()
+        self.end_time = when or datetime.now()
         if outputs is not None:
             self.outputs = outputs
         if claude_output is not None:
             self.claude_output = claude_output
 
-    def mark_failed(self, error: str) -> None:
+    def mark_failed(self, error: str, when: datetime | None = None) -> None:
         """Mark the job as failed."""
         self.status = JobStatus.FAILED
-        self.end_time = datetime.now()
+        self.end_time = when or datetime.now()
         self.error_message = error
 
-    def mark_skipped(self, reason: str | None = None) -> None:
+    def mark_skipped(self, reason: str | None = None, when: datetime | None = None) -> None:
         """Mark the job as skipped."""
         self.status = JobStatus.SKIPPED
-        self.end_time = datetime.now()
+        self.end_time = when or datetime.now()
         if reason:
             self.error_message = f"Skipped: {reason}"
 
-    def mark_cancelled(self) -> None:
+    def mark_cancelled(self, when: datetime | None = None) -> None:
         """Mark the job as cancelled."""
         self.status = JobStatus.CANCELLED
-        self.end_time = datetime.now()
+        self.end_time = when or datetime.now()
 
     def update_stats(
         self,
@@ -131,6 +145,25 @@ class JobResult(BaseModel):
         self.cost = cost
 
 
+_FINISHED_RUN_STATUSES = frozenset({
+    WorkflowStatus.COMPLETED,
+    WorkflowStatus.FAILED,
+    WorkflowStatus.CANCELLED,
+})
+
+
+class _Totals(NamedTuple):
+    """Aggregates over a run's job results, gathered in one pass."""
+
+    cost: float
+    tokens: int
+    input_tokens: int
+    output_tokens: int
+    completed: int
+    failed: int
+    skipped: int
+
+
 class WorkflowRun(BaseModel):
     """A specific execution of a workflow."""
 
@@ -145,6 +178,9 @@ class WorkflowRun(BaseModel):
 
     model_config = {"populate_by_name": True}
 
+    # Totals of a finished run; job results are edited in place while it runs
+    _totals: _Totals | None = PrivateAttr(default=None)
+
     @classmethod
     def create(
         cls,
@@ -160,25 +196,56 @@ class WorkflowRun(BaseModel):
             is_dry_run=is_dry_run,
         )
 
+    def _aggregate(self) -> _Totals:
+        """Costs, tokens and status counts, cached once the run has finished."""
+        if self._totals is not None:
+            return self._totals
+
+        totals = self._compute_totals()
+        if self.is_finished:
+            self._totals = totals
+        return totals
+
+    def _compute_totals(self) -> _Totals:
+        """Compute costs, tokens and status counts in a single walk over the results."""
+        cost = tokens = input_tokens = output_tokens = 0
+        completed = failed = skipped = 0
+        for r in self.job_results.values():
+            cost += r.cost or 0
+            if r.input_tokens is not None:
+                input_tokens += r.input_tokens
+                if r.output_tokens is not None:
+                    tokens += r.input_tokens + r.output_tokens
+            if r.output_tokens is not None:
+                output_tokens += r.output_tokens
+            status = r.status
+            if status is JobStatus.COMPLETED:
+                completed += 1
+            elif status is JobStatus.FAILED:
+                failed += 1
+            elif status is JobStatus.SKIPPED:
+                skipped += 1
+        return _Totals(cost, tokens, input_tokens, output_tokens, completed, failed, skipped)
+
     @property
     def total_cost(self) -> float:
         """Total cost of all jobs in the workflow."""
-        return sum(r.cost or 0 for r in self.job_results.values())
+        return self._aggregate().cost
 
     @property
     def total_tokens(self) -> int:
         """Total tokens used by all jobs."""
-        return sum(r.total_tokens or 0 for r in self.job_results.values())
+        return self._aggregate().tokens
 
     @property
     def total_input_tokens(self) -> int:
         """Total input tokens."""
-        return sum(r.input_tokens or 0 for r in self.job_results.values())
+        return self._aggregate().input_tokens
 
     @property
     def total_output_tokens(self) -> int:
         """Total output tokens."""
-        return sum(r.output_tokens or 0 for r in self.job_results.values())
+        return self._aggregate().output_tokens
 
     @property
     def duration(self) -> float | None:
@@ -190,17 +257,17 @@ class WorkflowRun(BaseModel):
     @property
     def completed_job_count(self) -> int:
         """Number of completed jobs."""
-        return sum(1 for r in self.job_results.values() if r.status == JobStatus.COMPLETED)
+        return self._aggregate().completed
 
     @property
     def failed_job_count(self) -> int:
         """Number of failed jobs."""
-        return sum(1 for r in self.job_results.values() if r.status == JobStatus.FAILED)
+        return self._aggregate().failed
 
     @property
     def skipped_job_count(self) -> int:
         """Number of skipped jobs."""
-        return sum(1 for r in self.job_results.values() if r.status == JobStatus.SKIPPED)
+        return self._aggregate().skipped
 
     @property
     def all_jobs_finished(self) -> bool:
@@ -210,28 +277,37 @@ class WorkflowRun(BaseModel):
     @property
     def is_running(self) -> bool:
         """Check if the workflow is still running."""
-        return self.status == WorkflowStatus.RUNNING
+        return self.status is WorkflowStatus.RUNNING
+
+    @property
+    def is_finished(self) -> bool:
+        """Check if the workflow has completed, failed or been cancelled."""
+        return self.status in _FINISHED_RUN_STATUSES
 
-    def mark_started(self) -> None:
+    def mark_started(self, when: datetime | None = None) -> None:
         """Mark the workflow as started."""
         self.status = WorkflowStatus.RUNNING
-        self.start_time = datetime.now()
+        self.start_time = when or datetime.now()
+        self._totals = None
 
-    def mark_completed(self) -> None:
+    def mark_completed(self, when: datetime | None = None) -> None:
         """Mark the workflow as completed."""
         self.status = WorkflowStatus.COMPLETED
-        self.end_time = datetime.now()
+        self.end_time = when or datetime.now()
+        self._totals = None
 
-    def mark_failed(self, error: str) -> None:
+    def mark_failed(self, error: str, when: datetime | None = None) -> None:
         """Mark the workflow as failed."""
         self.status = WorkflowStatus.FAILED
-        self.end_time = datetime.now()
+        self.end_time = when or datetime.now()
         self.error_message = error
+        self._totals = None
 
-    def mark_cancelled(self) -> None:
+    def mark_cancelled(self, when: datetime | None = None) -> None:
         """Mark the workflow as cancelled."""
         self.status = WorkflowStatus.CANCELLED
-        self.end_time = datetime.now()
+        self.end_time = when or datetime.now()
+        self._totals = None
 
     def job_result(self, name: str) -> JobResult | None:
         """Get result for a specific job."""
@@ -240,6 +316,7 @@ class WorkflowRun(BaseModel):
     def update_job_result(self, result: JobResult) -> None:
         """Update a job result."""
         self.job_results[result.job_name] = result
+        self._totals = None
 
     def outputs(self, job_name: str) -> dict[str, str]:
         """Get outputs for a specific job."""
@@ -253,28 +330,28 @@ class WorkflowRun(BaseModel):
 
     def ready_jobs(self, workflow: "Workflow") -> list[str]:
         """Get jobs that are ready to run (pending and all dependencies completed)."""
+        completed = {
+            name for name, result in self.job_results.items()
+            if result.status is JobStatus.COMPLETED
+        }
+
         ready = []
         for name, result in self.job_results.items():
-            if result.status != JobStatus.PENDING:
+            if result.status is not JobStatus.PENDING:
                 continue
 
             job = workflow.jobs.get(name)
             if not job:
                 continue
 
-            # Check if all dependencies are completed
-            if job.needs:
-                all_deps_done = all(
-                    self.job_results.get(dep, JobResult(job_name=dep)).status
-                    == JobStatus.COMPLETED
-                    for dep in job.needs
-                )
-                if not all_deps_done:
-                    continue
+            # Check if all dependencies are completed (a missing result counts as pending)
+            if job.needs and not completed.issuperset(job.needs):
+                continue
 
             ready.append(name)
 
-        return sorted(ready)
+        ready.sort()
+        return ready
 
     def summary(self) -> str:
         """Create a summary of the workflow run."""
@@ -290,17 +367,8 @@ class WorkflowRun(BaseModel):
         lines.append("")
         lines.append("Jobs:")
 
-        status_icons = {
-            JobStatus.PENDING: "○",
-            JobStatus.RUNNING: "◐",
-            JobStatus.COMPLETED: "●",
-            JobStatus.FAILED: "✗",
-            JobStatus.SKIPPED: "⊘",
-            JobStatus.CANCELLED: "◌",
-        }
-
         for name, result in sorted(self.job_results.items()):
-            icon = status_icons.get(result.status, "?")
+            icon = _STATUS_ICONS.get(result.status, "?")
             job_line = f"  {icon} {name}: {result.status.value}"
 
             if result.duration is not None:
@@ -311,14 +379,15 @@ class WorkflowRun(BaseModel):
 
             lines.append(job_line)
 
-            if result.status == JobStatus.FAILED and result.error_message:
+            if result.status is JobStatus.FAILED and result.error_message:
                 lines.append(f"      Error: {result.error_message}")
 
+        totals = self._aggregate()
         lines.append("")
-        lines.append(f"Total Cost: ${self.total_cost:.4f}")
+        lines.append(f"Total Cost: ${totals.cost:.4f}")
         lines.append(
-            f"Total Tokens: {self.total_tokens} "
-            f"({self.total_input_tokens} input, {self.total_output_tokens} output)"
+            f"Total Tokens: {totals.tokens} "
+            f"({totals.input_tokens} input, {totals.output_tokens} output)"
         )
 
         return "\n".join(lines)
@@ -356,9 +425,9 @@ class WorkflowStats(BaseModel):
         """Record statistics from a workflow run."""
         self.total_runs += 1
 
-        if run.status == WorkflowStatus.COMPLETED:
+        if run.status is WorkflowStatus.COMPLETED:
             self.successful_runs += 1
-        elif run.status == WorkflowStatus.FAILED:
+        elif run.status is WorkflowStatus.FAILED:
             self.failed_runs += 1
 
         self.total_cost += run.total_cost
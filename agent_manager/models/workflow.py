@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from pathlib import Path
 
 import yaml
 from typing_extensions import Self
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
 
 
-# Custom YAML loader that doesn't convert on/off/yes/no to booleans
-class SafeLineLoader(yaml.SafeLoader):
+# Custom YAML loader that doesn't convert on/off/yes/no to booleans. Built on
+# libyaml's C parser when PyYAML has it; the bool override below is Python-side
+# and applies either way
+class SafeLineLoader(getattr(yaml, "CSafeLoader", yaml.SafeLoader)):
     """YAML loader that keeps 'on', 'off', 'yes', 'no' as strings."""
     pass
 
@@ -24,7 +27,11 @@ SafeLineLoader.add_constructor(
 )
 
 
-def safe_yaml_load(content: str) -> dict:
+# libyaml's C dumper when PyYAML was built with it
+_SafeDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def safe_yaml_load(content: str | bytes) -> dict:
     """Load YAML without converting on/off/yes/no to booleans."""
     return yaml.load(content, Loader=SafeLineLoader)
 
@@ -55,12 +62,14 @@ class WorkflowTriggers(BaseModel):
 class WorkflowDefaults(BaseModel):
     """Default settings for jobs in a workflow."""
 
-    working_directory: str | None = Field(default=None, alias="working_directory")
-    max_budget_usd: float | None = Field(default=None, alias="max_budget_usd")
-    max_turns: int | None = Field(default=None, alias="max_turns")
-    allowed_tools: list[str] | None = Field(default=None, alias="allowed_tools")
-    permission_mode: str | None = Field(default=None, alias="permission_mode")
-    model: str | None = Field(default=None, alias="model")  # "opus", "sonnet", "haiku"
+    working_directory: str | None = None
+    max_budget_usd: float | None = None
+    max_turns: int | None = None
+    allowed_tools: list[str] | None = None
+    permission_mode: str | None = None
+    model: str | None = None  # "opus", "sonnet", "haiku"
+    # Max independent goals-based jobs to combine into one Claude call (unset = no batching)
+    batch_size: int | None = Field(default=None, ge=1)
 
     model_config = {"populate_by_name": True}
 
@@ -89,7 +98,7 @@ class Job(BaseModel):
     if_condition: str | None = Field(default=None, alias="if")
 
     # Session continuation - continue a previous job's Claude session
-    continue_session: str | None = Field(default=None, alias="continue_session")
+    continue_session: str | None = None
 
     # Structured outputs to extract from response
     report: list[str] | None = None
@@ -98,12 +107,12 @@ class Job(BaseModel):
     outputs: list[str] | None = None
 
     # Per-job overrides
-    working_directory: str | None = Field(default=None, alias="working_directory")
-    allowed_tools: list[str] | None = Field(default=None, alias="allowed_tools")
-    max_turns: int | None = Field(default=None, alias="max_turns")
-    max_budget_usd: float | None = Field(default=None, alias="max_budget_usd")
-    permission_mode: str | None = Field(default=None, alias="permission_mode")
-    model: str | None = Field(default=None, alias="model")  # "opus", "sonnet", "haiku"
+    working_directory: str | None = None
+    allowed_tools: list[str] | None = None
+    max_turns: int | None = None
+    max_budget_usd: float | None = None
+    permission_mode: str | None = None
+    model: str | None = None  # "opus", "sonnet", "haiku"
 
     model_config = {"populate_by_name": True}
 
@@ -133,6 +142,21 @@ class Job(BaseModel):
         return self.prompt is not None
 
 
+@dataclass(frozen=True)
+class ResolvedJobConfig:
+    """Effective settings for a job after applying workflow defaults.
+
+    Hashable, so jobs with identical settings can be grouped together.
+    """
+
+    working_directory: str
+    allowed_tools: tuple[str, ...]
+    max_turns: int
+    max_budget_usd: float
+    permission_mode: str | None
+    model: str | None
+
+
 class Workflow(BaseModel):
     """Executable workflow orchestration with jobs."""
 
@@ -141,7 +165,12 @@ class Workflow(BaseModel):
     on: WorkflowTriggers
     defaults: WorkflowDefaults | None = None
     jobs: dict[str, Job]
-    max_cost_usd: float | None = Field(default=None, alias="max_cost_usd")
+    max_cost_usd: float | None = None
+
+    _resolved_configs: dict[str, ResolvedJobConfig] = PrivateAttr(default_factory=dict)
+    _dependents: dict[str, list[str]] | None = PrivateAttr(default=None)
+    _topological_order: list[str] | None = PrivateAttr(default=None)
+    _root_jobs: list[str] | None = PrivateAttr(default=None)
 
     model_config = {"populate_by_name": True}
 
@@ -183,37 +212,11 @@ class Workflow(BaseModel):
                         f"Add it to ensure proper execution order."
                     )
 
-        # Check for cycles
-        self._detect_cycles()
+        # Check for cycles; the order found along the way is kept for topological_sort
+        self._topological_order = self._sort_topologically()
 
         return self
 
-    def _detect_cycles(self) -> None:
-        """Detect circular dependencies in the job graph."""
-        visited: set[str] = set()
-        rec_stack: set[str] = set()
-
-        def dfs(job_name: str, path: list[str]) -> None:
-            if job_name in rec_stack:
-                cycle_path = path + [job_name]
-                raise ValueError(f"Circular dependency detected: {' -> '.join(cycle_path)}")
-
-            if job_name in visited:
-                return
-
-            visited.add(job_name)
-            rec_stack.add(job_name)
-
-            job = self.jobs.get(job_name)
-            if job and job.needs:
-                for dep in job.needs:
-                    dfs(dep, path + [job_name])
-
-            rec_stack.remove(job_name)
-
-        for job_name in self.jobs:
-            dfs(job_name, [])
-
     @property
     def job_names(self) -> list[str]:
         """Get job names sorted alphabetically."""
@@ -273,50 +276,108 @@ class Workflow(BaseModel):
             return self.defaults.model
         return None  # Use Claude CLI default
 
-    def topological_sort(self) -> list[str]:
-        """Get jobs in topological order (respecting dependencies)."""
-        result: list[str] = []
-        visited: set[str] = set()
-        temp_mark: set[str] = set()
-
-        def visit(job_name: str) -> None:
-            if job_name in temp_mark:
-                raise ValueError(f"Circular dependency at '{job_name}'")
-            if job_name in visited:
-                return
+    @property
+    def batch_size(self) -> int | None:
+        """Get the max number of goals-based jobs to run in one provider call."""
+        if self.defaults and self.defaults.batch_size is not None:
+            return self.defaults.batch_size
+        return None
 
-            temp_mark.add(job_name)
+    def resolve_job_config(self, job_name: str) -> ResolvedJobConfig:
+        """Get all effective settings for a job, resolved once and then reused."""
+        resolved = self._resolved_configs.get(job_name)
+        if resolved is None:
+            resolved = ResolvedJobConfig(
+                working_directory=self.working_directory(job_name),
+                allowed_tools=tuple(self.allowed_tools(job_name)),
+                max_turns=self.max_turns(job_name),
+                max_budget_usd=self.max_budget(job_name),
+                permission_mode=self.permission_mode(job_name),
+                model=self.model(job_name),
+            )
+            self._resolved_configs[job_name] = resolved
+        return resolved
 
-            job = self.jobs.get(job_name)
-            if job and job.needs:
-                for dep in job.needs:
-                    visit(dep)
+    def topological_sort(self) -> list[str]:
+        """Get jobs in topological order (respecting dependencies)."""
+        if self._topological_order is None:
+            self._topological_order = self._sort_topologically()
+        return list(self._topological_order)
 
-            temp_mark.remove(job_name)
-            visited.add(job_name)
-            result.append(job_name)
+    def _sort_topologically(self) -> list[str]:
+        """Order jobs so each comes after everything it needs.
 
-        for job_name in sorted(self.jobs.keys()):
-            visit(job_name)
+        An iterative depth-first walk from each job in name order: a job is
+        placed once all of its needs are, and reaching a job that's still on
+        the current path means the graph has a cycle.
+        """
+        result: list[str] = []
+        placed: set[str] = set()
+
+        for root in sorted(self.jobs):
+            if root in placed:
+                continue
+
+            path = [root]
+            on_path = {root}
+            pending = [iter(self.jobs[root].needs or ())]
+            while pending:
+                dep = next(pending[-1], None)
+                if dep is None:
+                    # Everything this job needs is placed, so it can be too
+                    pending.pop()
+                    job_name = path.pop()
+                    on_path.remove(job_name)
+                    placed.add(job_name)
+                    result.append(job_name)
+                elif dep in on_path:
+                    cycle_path = path + [dep]
+                    raise ValueError(f"Circular dependency detected: {' -> '.join(cycle_path)}")
+                elif dep not in placed:
+                    path.append(dep)
+                    on_path.add(dep)
+                    pending.append(iter(self.jobs[dep].needs or ()))
 
         return result
 
     def root_jobs(self) -> list[str]:
         """Get jobs that have no dependencies (can start immediately)."""
-        return sorted([name for name, job in self.jobs.items() if not job.has_dependencies])
+        if self._root_jobs is None:
+            self._root_jobs = sorted(
+                name for name, job in self.jobs.items() if not job.has_dependencies
+            )
+        return list(self._root_jobs)
+
+    def critical_path_lengths(self) -> dict[str, int]:
+        """Get the number of jobs on the longest dependency chain starting at each job."""
+        lengths = dict.fromkeys(self.jobs, 1)
+
+        # Dependents come after their dependencies, so walking backwards settles
+        # each job's length before it's pushed down to the jobs it needs
+        for job_name in reversed(self.topological_sort()):
+            for dep in self.jobs[job_name].needs or ():
+                lengths[dep] = max(lengths[dep], lengths[job_name] + 1)
+
+        return lengths
 
     def dependents(self, job_name: str) -> list[str]:
         """Get jobs that depend on the given job."""
-        return sorted([
-            name for name, job in self.jobs.items()
-            if job.needs and job_name in job.needs
-        ])
+        if self._dependents is None:
+            # Build the reverse dependency map once instead of scanning every job per call
+            dependents: dict[str, list[str]] = {}
+            for name in sorted(self.jobs):
+                for dep in set(self.jobs[name].needs or ()):
+                    dependents.setdefault(dep, []).append(name)
+            self._dependents = dependents
+        return list(self._dependents.get(job_name, ()))
 
     @classmethod
     def load(cls, path: Path | str) -> Self:
         """Load a workflow from a YAML file."""
         path = Path(path)
-        data = safe_yaml_load(path.read_text())
+        # Bytes let the parser detect the encoding itself, as YAML specifies,
+        # instead of decoding with the locale's preferred encoding
+        data = safe_yaml_load(path.read_bytes())
         return cls.model_validate(data)
 
     @classmethod
@@ -328,7 +389,13 @@ class Workflow(BaseModel):
     def to_yaml(self) -> str:
         """Serialize workflow to YAML string."""
         data = self.model_dump(by_alias=True, exclude_none=True)
-        return yaml.dump(data, default_flow_style=False, sort_keys=False, allow_unicode=True)
+        return yaml.dump(
+            data,
+            Dumper=_SafeDumper,
+            default_flow_style=False,
+            sort_keys=False,
+            allow_unicode=True,
+        )
 
     def save(self, path: Path | str) -> None:
         """Save workflow to a YAML file."""
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -45,6 +46,13 @@ class LLMResponse:
         return None
 
 
+# Checks every provider applies: (predicate that flags a bad config, error message)
+_CONFIG_RULES: tuple[tuple[Callable[[ProviderConfig], bool], str], ...] = (
+    (lambda config: config.max_turns < 1, "max_turns must be at least 1"),
+    (lambda config: config.max_budget_usd <= 0, "max_budget_usd must be positive"),
+)
+
+
 class LLMProvider(ABC):
     """Abstract base class for LLM providers.
 
@@ -98,12 +106,4 @@ class LLMProvider(ABC):
 
     def validate_config(self, config: ProviderConfig) -> list[str]:
         """Validate configuration. Returns list of error messages."""
-        errors = []
-
-        if config.max_turns < 1:
-            errors.append("max_turns must be at least 1")
-
-        if config.max_budget_usd <= 0:
-            errors.append("max_budget_usd must be positive")
-
-        return errors
+        return [message for is_invalid, message in _CONFIG_RULES if is_invalid(config)]
@@ -40,11 +40,8 @@ class ClaudeCLIProvider(LLMProvider):
         session_id: str | None = None,
     ) -> LLMResponse:
         """Execute a prompt via the claude CLI."""
-        # Run in thread pool to not block event loop
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None, self.execute_sync, prompt, config, log_file, session_id
-        )
+        # Run in a worker thread to not block event loop
+        return await asyncio.to_thread(self.execute_sync, prompt, config, log_file, session_id)
 
     def execute_sync(
         self,
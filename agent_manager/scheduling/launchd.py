@@ -3,10 +3,20 @@
 from __future__ import annotations
 
 import plistlib
+import shutil
 import subprocess
 from dataclasses import dataclass
 from pathlib import Path
 
+# launchd CalendarInterval keys for the five cron fields, in cron order
+_CALENDAR_INTERVAL_KEYS = (
+    "Minute",  # 0-59
+    "Hour",  # 0-23
+    "Day",  # Day of month, 1-31
+    "Month",  # 1-12
+    "Weekday",  # 0-6, Sunday = 0
+)
+
 
 @dataclass
 class ScheduleInfo:
@@ -43,13 +53,9 @@ class LaunchAgentManager:
     def _find_agentctl(self) -> str:
         """Find the agentctl executable."""
         # Try to find in PATH
-        result = subprocess.run(
-            ["which", "agentctl"],
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode == 0:
-            return result.stdout.strip()
+        found = shutil.which("agentctl")
+        if found:
+            return found
 
         # Fall back to common locations
         common_paths = [
@@ -89,6 +95,36 @@ class LaunchAgentManager:
         )
         return result.returncode == 0
 
+    def enabled_workflows(self, workflow_names: list[str]) -> set[str]:
+        """Check which of several workflows are enabled, with one launchctl call.
+
+        Gives the same answers as is_enabled() for each name.
+        """
+        installed = [name for name in workflow_names if self.plist_path(name).exists()]
+        if not installed:
+            return set()
+
+        loaded = self._loaded_labels()
+        return {name for name in installed if self.label(name) in loaded}
+
+    def _loaded_labels(self) -> set[str]:
+        """Labels of all jobs currently loaded in launchd."""
+        result = subprocess.run(
+            ["launchctl", "list"],
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            return set()
+
+        # Output is a "PID\tStatus\tLabel" header followed by one row per job
+        labels = set()
+        for line in result.stdout.splitlines()[1:]:
+            fields = line.split("\t")
+            if len(fields) == 3:
+                labels.add(fields[2])
+        return labels
+
     def get_schedule_info(self, workflow_name: str, cron_schedules: list[str]) -> ScheduleInfo:
         """Get scheduling information for a workflow."""
         plist = self.plist_path(workflow_name)
@@ -196,44 +232,13 @@ class LaunchAgentManager:
         if len(parts) != 5:
             return None
 
-        minute, hour, day, month, weekday = parts
-
         interval: dict = {}
-
-        # Minute (0-59)
-        if minute != "*":
-            try:
-                interval["Minute"] = int(minute)
-            except ValueError:
-                pass
-
-        # Hour (0-23)
-        if hour != "*":
-            try:
-                interval["Hour"] = int(hour)
-            except ValueError:
-                pass
-
-        # Day of month (1-31)
-        if day != "*":
-            try:
-                interval["Day"] = int(day)
-            except ValueError:
-                pass
-
-        # Month (1-12)
-        if month != "*":
-            try:
-                interval["Month"] = int(month)
-            except ValueError:
-                pass
-
-        # Day of week (0-6, Sunday = 0)
-        if weekday != "*":
-            try:
-                interval["Weekday"] = int(weekday)
-            except ValueError:
-                pass
+        for key, value in zip(_CALENDAR_INTERVAL_KEYS, parts):
+            if value != "*":
+                try:
+                    interval[key] = int(value)
+                except ValueError:
+                    pass
 
         # Return empty dict for "every minute" (all wildcards)
         # Return None only for invalid cron expressions
@@ -244,14 +249,12 @@ class LaunchAgentManager:
         if not self.launch_agents_dir.exists():
             return []
 
-        enabled = []
-        for plist in self.launch_agents_dir.glob(f"{self.PLIST_PREFIX}.*.plist"):
+        names = [
             # Extract workflow name from filename
-            name = plist.stem.replace(f"{self.PLIST_PREFIX}.", "")
-            if self.is_enabled(name):
-                enabled.append(name)
-
-        return sorted(enabled)
+            plist.stem.replace(f"{self.PLIST_PREFIX}.", "")
+            for plist in self.launch_agents_dir.glob(f"{self.PLIST_PREFIX}.*.plist")
+        ]
+        return sorted(self.enabled_workflows(names))
 
 
 # Singleton instance
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import json
+import os
+import time
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -35,6 +38,17 @@ class AgentAlreadyExistsError(AgentStoreError):
         super().__init__(f"Agent '{name}' already exists")
 
 
+# How long after a file or directory changes before its mtime is trusted to detect
+# further changes
+_RACY_MTIME_NS = 2_000_000_000
+
+_TRIGGER_ICONS = {
+    TriggerType.SCHEDULE: "⏰",
+    TriggerType.MANUAL: "▶",
+    TriggerType.FILE_WATCH: "👁",
+}
+
+
 @dataclass
 class AgentInfo:
     """Summary information about an agent."""
@@ -55,12 +69,26 @@ class AgentInfo:
     @property
     def trigger_icon(self) -> str:
         """Icon for trigger type."""
-        icons = {
-            TriggerType.SCHEDULE: "⏰",
-            TriggerType.MANUAL: "▶",
-            TriggerType.FILE_WATCH: "👁",
-        }
-        return icons.get(self.trigger_type, "?")
+        return _TRIGGER_ICONS.get(self.trigger_type, "?")
+
+
+@dataclass
+class AgentSummary:
+    """The fields shown when listing agents, readable without parsing the agent file."""
+
+    name: str
+    description: str
+    working_directory: str
+    max_budget_usd: float
+    max_turns: int
+
+
+# Columns of the summary index file, which stores one array per field
+_SUMMARY_FIELDS = ("name", "description", "working_directory", "max_budget_usd", "max_turns")
+_SUMMARY_INDEX_VERSION = 1
+
+# A summary with the (mtime_ns, size) of the agent file it was read from
+_SummaryEntry = tuple[tuple[int, int], AgentSummary]
 
 
 class AgentStore:
@@ -74,6 +102,14 @@ class AgentStore:
         self.agents_directory = base_directory / "agents"
         self.logs_directory = base_directory / "logs"
         self.config_file = base_directory / "config.yaml"
+        self.summary_index_file = base_directory / "agents.index.json"
+
+        # Parsed agents keyed by name, with the (mtime_ns, size) of the file they came from
+        self._agent_cache: dict[str, tuple[tuple[int, int], Agent]] = {}
+        # Agent file paths by name; the mapping never changes, so it needs no invalidation
+        self._agent_paths: dict[str, Path] = {}
+        # Sorted agent names, with the mtime_ns of the directory they were listed from
+        self._name_index: tuple[int, list[str]] | None = None
 
     def ensure_directories_exist(self) -> None:
         """Ensure all required directories exist."""
@@ -82,22 +118,123 @@ class AgentStore:
 
     def agent_path(self, name: str) -> Path:
         """Get path to agent YAML file."""
-        return self.agents_directory / f"{name}.yaml"
+        path = self._agent_paths.get(name)
+        if path is None:
+            path = self._agent_paths[name] = self.agents_directory / f"{name}.yaml"
+        return path
 
     def log_directory(self, agent_name: str) -> Path:
         """Get path to agent's log directory."""
         return self.logs_directory / agent_name
 
     def list_agent_names(self) -> list[str]:
-        """List all agent names."""
-        if not self.agents_directory.exists():
+        """List all agent names.
+
+        The listing is reused until the directory's mtime changes, which it does
+        whenever an entry is added, removed or renamed.
+        """
+        try:
+            mtime_ns = os.stat(self.agents_directory).st_mtime_ns
+        except OSError:
+            return []
+
+        index = self._name_index
+        if index is not None and index[0] == mtime_ns:
+            return list(index[1])
+
+        names: list[str] = []
+        try:
+            # Plain entry names: no Path object or suffix parsing per file
+            with os.scandir(self.agents_directory) as entries:
+                for entry in entries:
+                    stem, dot, suffix = entry.name.rpartition(".")
+                    # The name check is free; is_file() comes from the directory
+                    # entry's type, so it only costs a stat for symlinks
+                    if stem and dot and suffix in ("yaml", "yml") and entry.is_file():
+                        names.append(stem)
+        except (FileNotFoundError, NotADirectoryError):
             return []
 
-        return sorted([
-            p.stem
-            for p in self.agents_directory.iterdir()
-            if p.suffix in (".yaml", ".yml")
-        ])
+        names.sort()
+        # A directory changed within the last couple of seconds may change again without
+        # its mtime moving on filesystems with coarse timestamps, so don't trust it yet
+        if time.time_ns() - mtime_ns > _RACY_MTIME_NS:
+            self._name_index = (mtime_ns, names)
+            return list(names)
+        self._name_index = None
+        return names
+
+    def agent_summaries(self) -> dict[str, AgentSummary]:
+        """Summaries of every agent that loads, keyed by agent name.
+
+        Fields come from an index file written by the previous call; only agent files
+        whose (mtime_ns, size) changed since then are parsed again. Agents that fail
+        to load are left out.
+        """
+        index = self._read_summary_index()
+        # Files changed within the last couple of seconds may change again without their
+        # (mtime_ns, size) moving, so they're summarized but not indexed yet
+        trusted_before = time.time_ns() - _RACY_MTIME_NS
+
+        entries: dict[str, _SummaryEntry] = {}
+        indexed: dict[str, _SummaryEntry] = {}
+        for name in self.list_agent_names():
+            try:
+                stat = self.agent_path(name).stat()
+            except OSError:
+                continue
+
+            key = (stat.st_mtime_ns, stat.st_size)
+            entry = index.get(name)
+            if entry is None or entry[0] != key:
+                try:
+                    agent = self._load_shared(name)
+                except Exception:
+                    continue  # Skip invalid agents
+                entry = (key, AgentSummary(*(getattr(agent, field) for field in _SUMMARY_FIELDS)))
+            entries[name] = entry
+            if stat.st_mtime_ns < trusted_before:
+                indexed[name] = entry
+
+        if indexed != index:
+            self._write_summary_index(indexed)
+
+        return {name: summary for name, (_, summary) in entries.items()}
+
+    def _read_summary_index(self) -> dict[str, _SummaryEntry]:
+        """Read the summary index, or nothing if it's missing or unreadable."""
+        try:
+            data = json.loads(self.summary_index_file.read_bytes())
+            if data["version"] != _SUMMARY_INDEX_VERSION:
+                return {}
+            columns = [data[field] for field in _SUMMARY_FIELDS]
+            return {
+                file: ((mtime_ns, size), AgentSummary(*row))
+                for file, mtime_ns, size, *row in zip(
+                    data["files"], data["mtime_ns"], data["size"], *columns
+                )
+            }
+        except (OSError, ValueError, KeyError, TypeError):
+            return {}
+
+    def _write_summary_index(self, entries: dict[str, _SummaryEntry]) -> None:
+        """Replace the summary index file with entries."""
+        data: dict[str, object] = {
+            "version": _SUMMARY_INDEX_VERSION,
+            "files": list(entries),
+            "mtime_ns": [key[0] for key, _ in entries.values()],
+            "size": [key[1] for key, _ in entries.values()],
+        }
+        for field in _SUMMARY_FIELDS:
+            data[field] = [getattr(summary, field) for _, summary in entries.values()]
+
+        # Write then rename, so concurrent readers never see a partial file
+        tmp = self.summary_index_file.with_name(f".{self.summary_index_file.name}.{os.getpid()}")
+        try:
+            tmp.write_text(json.dumps(data))
+            os.replace(tmp, self.summary_index_file)
+        except OSError:
+            tmp.unlink(missing_ok=True)  # The index is only a cache
 
     def list_agents(self) -> list[Agent]:
         """Load all agents."""
@@ -110,13 +247,36 @@ class AgentStore:
         return agents
 
     def load(self, name: str) -> Agent:
-        """Load a specific agent by name."""
+        """Load a specific agent by name.
+
+        Unchanged agent files are served from a cache instead of being parsed
+        and validated again; each caller gets its own copy.
+        """
+        return self._load_shared(name).model_copy(deep=True)
+
+    def _load_shared(self, name: str) -> Agent:
+        """Load an agent through the cache, returning the cached instance itself.
+
+        Callers must treat the result as read-only.
+        """
         path = self.agent_path(name)
 
-        if not path.exists():
+        try:
+            stat = path.stat()
+        except OSError:
             raise AgentNotFoundError(name)
 
-        return Agent.load(path)
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._agent_cache.get(name)
+        if cached is None or cached[0] != key:
+            cached = (key, Agent.load(path))
+            # Like the summary index, only cache files whose mtime can be trusted
+            if time.time_ns() - stat.st_mtime_ns > _RACY_MTIME_NS:
+                self._agent_cache[name] = cached
+            else:
+                self._agent_cache.pop(name, None)
+
+        return cached[1]
 
     def exists(self, name: str) -> bool:
         """Check if an agent exists."""
@@ -127,6 +287,8 @@ class AgentStore:
         self.ensure_directories_exist()
         path = self.agent_path(agent.name)
         agent.save(path)
+        self._agent_cache.pop(agent.name, None)
+        self._name_index = None
 
     def delete(self, name: str) -> None:
         """Delete an agent."""
@@ -136,10 +298,13 @@ class AgentStore:
             raise AgentNotFoundError(name)
 
         path.unlink()
+        self._agent_cache.pop(name, None)
+        self._name_index = None
 
     def get_agent_info(self, name: str) -> AgentInfo:
         """Get agent status info (for list command)."""
-        agent = self.load(name)
+        # Only a few fields are read, so the cached agent doesn't need copying
+        agent = self._load_shared(name)
         # TODO: Check LaunchAgent status and load stats
         is_enabled = False  # Placeholder
         last_run = None  # Placeholder
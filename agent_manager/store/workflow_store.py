@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
-import json
+import heapq
+import os
+import shutil
+import time
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
+from pydantic import BaseModel, Field, TypeAdapter
+
 from agent_manager.models.result import WorkflowRun, WorkflowStats, WorkflowStatus
 from agent_manager.models.workflow import Workflow
+from agent_manager.store.agent_store import _RACY_MTIME_NS
 
 
 class WorkflowStoreError(Exception):
@@ -41,6 +47,15 @@ class RunNotFoundError(WorkflowStoreError):
         super().__init__(f"Workflow run '{run_id}' not found")
 
 
+_RUN_STATUS_ICONS = {
+    WorkflowStatus.COMPLETED: "✓",
+    WorkflowStatus.FAILED: "✗",
+    WorkflowStatus.RUNNING: "◐",
+    WorkflowStatus.CANCELLED: "◌",
+    WorkflowStatus.PENDING: "○",
+}
+
+
 @dataclass
 class WorkflowInfo:
     """Summary information about a workflow."""
@@ -64,14 +79,25 @@ class WorkflowInfo:
         """Icon for last run status."""
         if self.last_run_status is None:
             return None
-        icons = {
-            WorkflowStatus.COMPLETED: "✓",
-            WorkflowStatus.FAILED: "✗",
-            WorkflowStatus.RUNNING: "◐",
-            WorkflowStatus.CANCELLED: "◌",
-            WorkflowStatus.PENDING: "○",
-        }
-        return icons.get(self.last_run_status)
+        return _RUN_STATUS_ICONS.get(self.last_run_status)
+
+
+class _RunHeader(BaseModel):
+    """The parts of a saved run that workflow listings show.
+
+    Validating a run file against this skips building its job results.
+    """
+
+    status: WorkflowStatus = WorkflowStatus.PENDING
+    start_time: datetime = Field(default_factory=datetime.now)
+    end_time: datetime | None = None
+
+
+# Serializes runs straight to UTF-8 JSON bytes, without model_dump_json's str
+_RUN_ADAPTER = TypeAdapter(WorkflowRun)
+
+# Stats file contents: workflow name -> stats, validated from and dumped to JSON bytes directly
+_ALL_STATS_ADAPTER = TypeAdapter(dict[str, WorkflowStats])
 
 
 class WorkflowStore:
@@ -86,6 +112,13 @@ class WorkflowStore:
         self.runs_directory = base_directory / "runs"
         self.stats_file = base_directory / "workflow-stats.json"
 
+        # Parsed workflows keyed by name, with the (mtime_ns, size) of the file they came from
+        self._workflow_cache: dict[str, tuple[tuple[int, int], Workflow]] = {}
+        # Workflow file and run directory paths by name; the mapping never changes,
+        # so it needs no invalidation
+        self._workflow_paths: dict[str, Path] = {}
+        self._run_directories: dict[str, Path] = {}
+
     def ensure_directories_exist(self) -> None:
         """Ensure all required directories exist."""
         self.workflows_directory.mkdir(parents=True, exist_ok=True)
@@ -95,11 +128,17 @@ class WorkflowStore:
 
     def workflow_path(self, name: str) -> Path:
         """Get path to workflow YAML file."""
-        return self.workflows_directory / f"{name}.yaml"
+        path = self._workflow_paths.get(name)
+        if path is None:
+            path = self._workflow_paths[name] = self.workflows_directory / f"{name}.yaml"
+        return path
 
     def run_directory(self, workflow_name: str) -> Path:
         """Get path to workflow's run directory."""
-        return self.runs_directory / workflow_name
+        path = self._run_directories.get(workflow_name)
+        if path is None:
+            path = self._run_directories[workflow_name] = self.runs_directory / workflow_name
+        return path
 
     def run_path(self, workflow_name: str, run_id: str) -> Path:
         """Get path to a specific run file."""
@@ -113,14 +152,21 @@ class WorkflowStore:
 
     def list_workflow_names(self) -> list[str]:
         """List all workflow names."""
-        if not self.workflows_directory.exists():
+        names: list[str] = []
+        try:
+            # Plain entry names: no Path object or suffix parsing per file
+            with os.scandir(self.workflows_directory) as entries:
+                for entry in entries:
+                    stem, dot, suffix = entry.name.rpartition(".")
+                    # The name check is free; is_file() comes from the directory
+                    # entry's type, so it only costs a stat for symlinks
+                    if stem and dot and suffix in ("yaml", "yml") and entry.is_file():
+                        names.append(stem)
+        except (FileNotFoundError, NotADirectoryError):
             return []
 
-        return sorted([
-            p.stem
-            for p in self.workflows_directory.iterdir()
-            if p.suffix in (".yaml", ".yml")
-        ])
+        names.sort()
+        return names
 
     def list_workflows(self) -> list[Workflow]:
         """Load all workflows."""
@@ -133,13 +179,30 @@ class WorkflowStore:
         return workflows
 
     def load(self, name: str) -> Workflow:
-        """Load a specific workflow by name."""
+        """Load a specific workflow by name.
+
+        Unchanged workflow files are served from a cache instead of being parsed
+        and validated again; each caller gets its own copy.
+        """
         path = self.workflow_path(name)
 
-        if not path.exists():
+        try:
+            stat = path.stat()
+        except OSError:
             raise WorkflowNotFoundError(name)
 
-        return Workflow.load(path)
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._workflow_cache.get(name)
+        if cached is None or cached[0] != key:
+            cached = (key, Workflow.load(path))
+            # A file changed within the last couple of seconds may be rewritten without
+            # its (mtime_ns, size) moving, so only cache it once its mtime can be trusted
+            if time.time_ns() - stat.st_mtime_ns > _RACY_MTIME_NS:
+                self._workflow_cache[name] = cached
+            else:
+                self._workflow_cache.pop(name, None)
+
+        return cached[1].model_copy(deep=True)
 
     def exists(self, name: str) -> bool:
         """Check if a workflow exists."""
@@ -150,6 +213,7 @@ class WorkflowStore:
         self.ensure_directories_exist()
         path = self.workflow_path(workflow.name)
         workflow.save(path)
+        self._workflow_cache.pop(workflow.name, None)
 
     def delete(self, name: str) -> None:
         """Delete a workflow."""
@@ -159,15 +223,20 @@ class WorkflowStore:
             raise WorkflowNotFoundError(name)
 
         path.unlink()
+        self._workflow_cache.pop(name, None)
 
     def get_workflow_info(self, name: str) -> WorkflowInfo:
         """Get workflow info for display."""
+        return self._get_workflow_info(name, self.load_all_workflow_stats())
+
+    def _get_workflow_info(self, name: str, all_stats: dict[str, WorkflowStats]) -> WorkflowInfo:
+        """Get workflow info for display, with its stats taken from all_stats."""
         workflow = self.load(name)
         # TODO: Check LaunchAgent status
         is_enabled = False  # Placeholder
 
-        stats = self.load_workflow_stats(name)
-        last_run = self.load_last_run(name)
+        stats = all_stats.get(name, WorkflowStats())
+        last_run = self._load_last_run_header(name)
 
         return WorkflowInfo(
             name=workflow.name,
@@ -182,10 +251,12 @@ class WorkflowStore:
 
     def list_workflow_info(self) -> list[WorkflowInfo]:
         """Get info for all workflows."""
+        # One read of the stats file for every workflow
+        all_stats = self.load_all_workflow_stats()
         infos = []
         for name in self.list_workflow_names():
             try:
-                infos.append(self.get_workflow_info(name))
+                infos.append(self._get_workflow_info(name, all_stats))
             except Exception:
                 pass
         return infos
@@ -194,16 +265,21 @@ class WorkflowStore:
 
     def save_run(self, run: WorkflowRun) -> None:
         """Save a workflow run."""
-        self.ensure_directories_exist()
-
-        run_dir = self.run_directory(run.workflow_name)
-        run_dir.mkdir(parents=True, exist_ok=True)
-
         run_path = self.run_path(run.workflow_name, run.id)
-        run_path.write_text(run.model_dump_json(by_alias=True, indent=2))
+        data = _RUN_ADAPTER.dump_json(run, by_alias=True, indent=2)
 
-        # Update workflow stats
-        self._update_workflow_stats(run.workflow_name, run)
+        # A run is saved several times as it progresses, so only create its
+        # directory when the write shows it's missing
+        try:
+            run_path.write_bytes(data)
+        except FileNotFoundError:
+            run_path.parent.mkdir(parents=True, exist_ok=True)
+            run_path.write_bytes(data)
+
+        # Intermediate saves of a running run must not count towards the stats,
+        # so they're only recorded once the run has finished
+        if run.is_finished:
+            self._update_workflow_stats(run.workflow_name, run)
 
     def load_run(self, workflow_name: str, run_id: str) -> WorkflowRun:
         """Load a specific run."""
@@ -212,28 +288,14 @@ class WorkflowStore:
         if not path.exists():
             raise RunNotFoundError(run_id)
 
-        data = json.loads(path.read_text())
-        return WorkflowRun.model_validate(data)
+        return WorkflowRun.model_validate_json(path.read_bytes())
 
     def list_runs(self, workflow_name: str, limit: int = 10) -> list[WorkflowRun]:
         """List runs for a workflow (most recent first)."""
-        run_dir = self.run_directory(workflow_name)
-
-        if not run_dir.exists():
-            return []
-
-        # Get JSON files sorted by modification time (newest first)
-        run_files = sorted(
-            [p for p in run_dir.iterdir() if p.suffix == ".json"],
-            key=lambda p: p.stat().st_mtime,
-            reverse=True,
-        )
-
         runs = []
-        for path in run_files[:limit]:
+        for entry in self._run_files(workflow_name, limit):
             try:
-                data = json.loads(path.read_text())
-                runs.append(WorkflowRun.model_validate(data))
+                runs.append(WorkflowRun.model_validate_json(Path(entry.path).read_bytes()))
             except Exception:
                 pass  # Skip invalid runs
 
@@ -244,31 +306,74 @@ class WorkflowStore:
         runs = self.list_runs(workflow_name, limit=1)
         return runs[0] if runs else None
 
-    def prune_runs(self, workflow_name: str, keep_count: int = 50) -> None:
-        """Delete old runs (keep most recent N)."""
-        run_dir = self.run_directory(workflow_name)
-
-        if not run_dir.exists():
-            return
+    def _load_last_run_header(self, workflow_name: str) -> _RunHeader | None:
+        """Get the status and times of the most recent run, like load_last_run."""
+        for entry in self._run_files(workflow_name, 1):
+            try:
+                return _RunHeader.model_validate_json(Path(entry.path).read_bytes())
+            except Exception:
+                pass  # Skip invalid runs
+        return None
+
+    def find_run(
+        self, workflow_name: str, run_id_prefix: str, limit: int = 50
+    ) -> WorkflowRun | None:
+        """Get the most recent run whose ID starts with a prefix.
+
+        Only the newest `limit` runs are searched. Matching is done on file
+        names, so only the matching run is read and parsed.
+        """
+        for entry in self._run_files(workflow_name, limit):
+            if not entry.name[:-5].startswith(run_id_prefix):
+                continue
+            try:
+                return WorkflowRun.model_validate_json(Path(entry.path).read_bytes())
+            except Exception:
+                pass  # Skip invalid runs
 
-        # Get JSON files sorted by modification time (newest first)
-        run_files = sorted(
-            [p for p in run_dir.iterdir() if p.suffix == ".json"],
-            key=lambda p: p.stat().st_mtime,
-            reverse=True,
-        )
+        return None
 
+    def prune_runs(self, workflow_name: str, keep_count: int = 50) -> None:
+        """Delete old runs (keep most recent N)."""
         # Delete runs beyond the keep count
-        for path in run_files[keep_count:]:
+        for entry in self._run_files(workflow_name)[keep_count:]:
+            path = Path(entry.path)
             path.unlink(missing_ok=True)
 
             # Also delete the log directory if it exists
             log_dir = path.with_suffix("")
             if log_dir.is_dir():
-                import shutil
-
                 shutil.rmtree(log_dir, ignore_errors=True)
 
+    def _run_files(self, workflow_name: str, limit: int | None = None) -> list[os.DirEntry[str]]:
+        """Get a workflow's run files, sorted by modification time (newest first).
+
+        With a limit, only the newest `limit` files are returned, picked without
+        sorting the rest.
+        """
+        files: list[tuple[float, os.DirEntry[str]]] = []
+        try:
+            # Entries carry their name and path, so no Path is built for runs that
+            # are never opened
+            with os.scandir(self.run_directory(workflow_name)) as entries:
+                for entry in entries:
+                    stem, dot, suffix = entry.name.rpartition(".")
+                    if not (stem and dot and suffix == "json") or not entry.is_file():
+                        continue
+                    try:
+                        files.append((entry.stat().st_mtime, entry))
+                    except FileNotFoundError:
+                        pass  # Removed since the directory was read
+        except (FileNotFoundError, NotADirectoryError):
+            return []
+
+        if limit is None:
+            files.sort(key=lambda file: file[0], reverse=True)
+        else:
+            # Same order as the sorted slice, ties included
+            files = heapq.nlargest(limit, files, key=lambda file: file[0])
+        return [entry for _, entry in files]
+
     # MARK: - Stats Operations
 
     def load_all_workflow_stats(self) -> dict[str, WorkflowStats]:
@@ -276,10 +381,7 @@ class WorkflowStore:
         if not self.stats_file.exists():
             return {}
 
-        data = json.loads(self.stats_file.read_text())
-        return {
-            name: WorkflowStats.model_validate(stats) for name, stats in data.items()
-        }
+        return _ALL_STATS_ADAPTER.validate_json(self.stats_file.read_bytes())
 
     def load_workflow_stats(self, name: str) -> WorkflowStats:
         """Load stats for a specific workflow."""
@@ -288,9 +390,16 @@ class WorkflowStore:
 
     def _save_workflow_stats(self, stats: dict[str, WorkflowStats]) -> None:
         """Save workflow stats."""
-        data = {name: s.model_dump(by_alias=True) for name, s in stats.items()}
         self.stats_file.parent.mkdir(parents=True, exist_ok=True)
-        self.stats_file.write_text(json.dumps(data, indent=2, default=str))
+
+        # Write then rename, so concurrent readers never see a partial file
+        tmp = self.stats_file.with_name(f".{self.stats_file.name}.{os.getpid()}")
+        try:
+            tmp.write_bytes(_ALL_STATS_ADAPTER.dump_json(stats, by_alias=True, indent=2))
+            os.replace(tmp, self.stats_file)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+            raise
 
     def _update_workflow_stats(self, name: str, run: WorkflowRun) -> None:
         """Update stats for a workflow after a run."""
@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import locale
+import os
+import sys
+from pathlib import Path
 from typing import Optional
 
 import typer
@@ -18,6 +22,25 @@ app = typer.Typer(
 app.add_typer(agent.app, name="agent", help="Manage reusable agent templates")
 app.add_typer(workflow.app, name="workflow", help="Manage workflow orchestrations")
 
+# Icons for job status updates printed by `run`, keyed by status value so the
+# models don't need importing at startup
+_JOB_STATUS_ICONS = {
+    "pending": "○",
+    "running": "◐",
+    "completed": "●",
+    "failed": "✗",
+    "skipped": "⊘",
+    "cancelled": "◌",
+}
+
+# Rich colors for run statuses in the `status` table
+_RUN_STATUS_COLORS = {
+    "completed": "green",
+    "failed": "red",
+    "running": "yellow",
+    "cancelled": "dim",
+}
+
 
 # Top-level commands for common operations
 @app.command()
@@ -32,7 +55,7 @@ def run(
     from agent_manager.execution.workflow_runner import get_workflow_runner
     from agent_manager.store.workflow_store import get_workflow_store
 
-    console = Console()
+    console = Console(highlight=False)
     store = get_workflow_store()
     runner = get_workflow_runner()
 
@@ -61,17 +84,7 @@ def run(
 
     # Run with status callback
     def status_callback(job_name: str, status: "JobStatus") -> None:
-        from agent_manager.models.result import JobStatus
-
-        icons = {
-            JobStatus.PENDING: "○",
-            JobStatus.RUNNING: "◐",
-            JobStatus.COMPLETED: "●",
-            JobStatus.FAILED: "✗",
-            JobStatus.SKIPPED: "⊘",
-            JobStatus.CANCELLED: "◌",
-        }
-        console.print(f"  {icons.get(status, '?')} {job_name}: {status.value}")
+        console.print(f"  {_JOB_STATUS_ICONS.get(status.value, '?')} {job_name}: {status.value}")
 
     result = runner.run_sync(wf, dry_run=dry_run, single_job=job, status_callback=status_callback)
 
@@ -80,15 +93,17 @@ def run(
     console.print()
 
     # Show job outputs if any were captured
-    has_outputs = any(r.outputs for r in result.job_results.values())
-    if has_outputs:
+    output_sections = [
+        (job_name, job_result.outputs)
+        for job_name, job_result in sorted(result.job_results.items())
+        if job_result.outputs
+    ]
+    if output_sections:
         console.print("[bold]Outputs:[/bold]")
         console.print()
-        for job_name, job_result in sorted(result.job_results.items()):
-            if not job_result.outputs:
-                continue
+        for job_name, outputs in output_sections:
             console.print(f"  [bold cyan]{job_name}:[/bold cyan]")
-            for key, value in job_result.outputs.items():
+            for key, value in outputs.items():
                 # Wrap long values
                 if len(value) > 120:
                     console.print(f"    [bold]{key}:[/bold]")
@@ -112,10 +127,11 @@ def status(
     """Show recent workflow runs."""
     from rich.console import Console
     from rich.table import Table
+    from rich.text import Text
 
     from agent_manager.store.workflow_store import get_workflow_store
 
-    console = Console()
+    console = Console(highlight=False)
     store = get_workflow_store()
 
     if not store.exists(name):
@@ -148,19 +164,16 @@ def status(
         table.add_column("Jobs")
 
         for run in runs:
-            status_color = {
-                "completed": "green",
-                "failed": "red",
-                "running": "yellow",
-                "cancelled": "dim",
-            }.get(run.status.value, "")
+            # A pre-styled Text skips markup parsing, and a status without a
+            # color (e.g. pending) no longer renders as the invalid markup "[]...[/]"
+            status_text = Text(run.status.value, style=_RUN_STATUS_COLORS.get(run.status.value, ""))
 
             duration = f"{run.duration:.1f}s" if run.duration else "running"
             jobs = f"{run.completed_job_count}/{len(run.job_results)}"
 
             table.add_row(
                 run.id[:8],
-                f"[{status_color}]{run.status.value}[/{status_color}]",
+                status_text,
                 run.start_time.strftime("%Y-%m-%d %H:%M"),
                 duration,
                 f"${run.total_cost:.4f}",
@@ -172,6 +185,49 @@ def status(
         console.print(f"Show details: agentctl status {name} --run-id <id>")
 
 
+def _job_log_file(log_dir: Path, job_name: str, recorded: str | None) -> Path:
+    """Get a job's log file, preferring the path recorded on its result.
+
+    Batched jobs share one provider call, so their results all point at its log.
+    """
+    return Path(recorded) if recorded else log_dir / f"{job_name}.log"
+
+
+def _tail_lines(path: Path, count: int, chunk_size: int = 65536) -> list[str]:
+    """Return path.read_text().split("\n")[-count:] without reading the whole file.
+
+    Reads backwards in chunks until count line breaks have been seen, then decodes
+    only that tail. Universal newlines are applied just as read_text() would.
+    """
+    encoding = locale.getpreferredencoding(False)
+
+    def split(data: bytes) -> list[str]:
+        return data.decode(encoding).replace("\r\n", "\n").replace("\r", "\n").split("\n")
+
+    with path.open("rb") as f:
+        position = f.seek(0, os.SEEK_END)
+        buf = b""
+        while position > 0:
+            step = min(chunk_size, position)
+            position -= step
+            f.seek(position)
+            buf = f.read(step) + buf
+            if position == 0:
+                break
+
+            # Everything before the first line break may be a partial line (or character)
+            cut = min((i for i in (buf.find(b"\n"), buf.find(b"\r")) if i != -1), default=-1)
+            if cut == -1:
+                continue
+            if buf[cut:cut + 2] == b"\r\n":
+                cut += 1
+            pieces = split(buf[cut + 1:])
+            if len(pieces) >= count:
+                return pieces[-count:]
+
+        return split(buf)[-count:]
+
+
 @app.command()
 def logs(
     name: str = typer.Argument(..., help="Name of the workflow"),
@@ -181,14 +237,12 @@ def logs(
     lines: int = typer.Option(50, "--lines", "-n", help="Number of lines to show"),
 ) -> None:
     """View workflow execution logs."""
-    import subprocess
-
     from rich.console import Console
     from rich.syntax import Syntax
 
     from agent_manager.store.workflow_store import get_workflow_store
 
-    console = Console()
+    console = Console(highlight=False)
     store = get_workflow_store()
 
     if not store.exists(name):
@@ -198,12 +252,10 @@ def logs(
     # Determine which run to show logs for
     if run_id:
         # Use specific run ID (supports partial match)
-        runs = store.list_runs(name, limit=50)
-        matching = [r for r in runs if r.id.startswith(run_id)]
-        if not matching:
+        target_run = store.find_run(name, run_id)
+        if not target_run:
             console.print(f"[red]Error:[/red] No run found matching '{run_id}'")
             raise typer.Exit(1)
-        target_run = matching[0]
     else:
         # Use most recent run
         target_run = store.load_last_run(name)
@@ -216,20 +268,23 @@ def logs(
 
     if job:
         # Show logs for specific job
-        log_file = log_dir / f"{job}.log"
+        result = target_run.job_results.get(job)
+        log_file = _job_log_file(log_dir, job, result.log_file if result else None)
         if not log_file.exists():
             console.print(f"[red]Error:[/red] No log file found for job '{job}'")
             console.print(f"Available jobs: {', '.join(target_run.job_results.keys())}")
             raise typer.Exit(1)
 
         if follow:
-            # Use tail -f for following
-            subprocess.run(["tail", "-f", str(log_file)])
+            # Hand the terminal over to tail (-F survives log rotation) instead of
+            # keeping this process alive as its parent
+            sys.stdout.flush()
+            os.execvp("tail", ["tail", "-F", str(log_file)])
         else:
-            content = log_file.read_text()
-            log_lines = content.split("\n")
-            if len(log_lines) > lines:
-                log_lines = log_lines[-lines:]
+            if lines > 0:
+                log_lines = _tail_lines(log_file, lines)
+            else:
+                log_lines = log_file.read_text().split("\n")
             console.print(Syntax("\n".join(log_lines), "text", theme="monokai"))
     else:
         # Show logs for all jobs
@@ -238,7 +293,7 @@ def logs(
         console.print()
 
         for job_name, result in sorted(target_run.job_results.items()):
-            log_file = log_dir / f"{job_name}.log"
+            log_file = _job_log_file(log_dir, job_name, result.log_file)
 
             console.print(f"[bold cyan]── {job_name} ──[/bold cyan]")
             console.print(f"Status: {result.status.value}")
@@ -266,7 +321,7 @@ def enable(
     from agent_manager.scheduling import get_launch_agent_manager
     from agent_manager.store.workflow_store import get_workflow_store
 
-    console = Console()
+    console = Console(highlight=False)
     store = get_workflow_store()
     manager = get_launch_agent_manager()
 
@@ -313,7 +368,7 @@ def disable(
     from agent_manager.scheduling import get_launch_agent_manager
     from agent_manager.store.workflow_store import get_workflow_store
 
-    console = Console()
+    console = Console(highlight=False)
     store = get_workflow_store()
     manager = get_launch_agent_manager()
 
@@ -338,7 +393,7 @@ def schedule(
     from agent_manager.scheduling import get_launch_agent_manager
     from agent_manager.store.workflow_store import get_workflow_store
 
-    console = Console()
+    console = Console(highlight=False)
     store = get_workflow_store()
     manager = get_launch_agent_manager()
 
@@ -378,10 +433,13 @@ def schedule(
         table.add_column("Schedule")
         table.add_column("Enabled")
 
+        # One launchctl call for every workflow instead of one per workflow
+        enabled = manager.enabled_workflows(workflows)
+
         for wf_name in workflows:
             try:
                 wf = store.load(wf_name)
-                is_enabled = manager.is_enabled(wf_name)
+                is_enabled = wf_name in enabled
 
                 if wf.on.schedule:
                     schedules = ", ".join(s.cron for s in wf.on.schedule)
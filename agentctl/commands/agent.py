@@ -5,10 +5,6 @@ from __future__ import annotations
 from typing import Annotated
 
 import typer
-from rich.console import Console
-from rich.table import Table
-
-from agent_manager.store.agent_store import get_agent_store
 
 app = typer.Typer(help="Manage reusable agent templates")
 
@@ -16,7 +12,12 @@ app = typer.Typer(help="Manage reusable agent templates")
 @app.command("list")
 def list_agents() -> None:
     """List all agent templates."""
-    console = Console()
+    from rich.console import Console
+    from rich.table import Table
+
+    from agent_manager.store.agent_store import get_agent_store
+
+    console = Console(highlight=False)
     store = get_agent_store()
 
     agents = store.list_agent_names()
@@ -33,9 +34,12 @@ def list_agents() -> None:
     table.add_column("Max Budget")
     table.add_column("Max Turns")
 
+    # Unchanged agents are listed from the summary index instead of being parsed
+    summaries = store.agent_summaries()
+
     for name in agents:
         try:
-            agent = store.load(name)
+            agent = summaries.get(name) or store.load(name)
             table.add_row(
                 agent.name,
                 agent.description[:40] + "..." if len(agent.description) > 40 else agent.description,
@@ -54,7 +58,11 @@ def show_agent(
     name: Annotated[str, typer.Argument(help="Name of the agent to show")],
 ) -> None:
     """Show agent template details."""
-    console = Console()
+    from rich.console import Console
+
+    from agent_manager.store.agent_store import get_agent_store
+
+    console = Console(highlight=False)
     store = get_agent_store()
 
     if not store.exists(name):
@@ -76,9 +84,12 @@ def create_agent(
     edit: Annotated[bool, typer.Option("--edit", "-e", help="Open in editor after creation")] = False,
 ) -> None:
     """Create a new agent template."""
-    import subprocess
+    from rich.console import Console
 
-    console = Console()
+    from agent_manager.store.agent_store import get_agent_store
+    from agentctl.editor import open_in_editor
+
+    console = Console(highlight=False)
     store = get_agent_store()
 
     if store.exists(name):
@@ -111,11 +122,7 @@ max_budget_usd: {max_budget}
     console.print(f"[green]Created agent template:[/green] {agent_file}")
 
     if edit:
-        editor = subprocess.run(["which", "code"], capture_output=True, text=True)
-        if editor.returncode == 0:
-            subprocess.run(["code", str(agent_file)])
-        else:
-            subprocess.run(["open", "-e", str(agent_file)])
+        open_in_editor(agent_file)
 
 
 @app.command("edit")
@@ -123,9 +130,12 @@ def edit_agent(
     name: Annotated[str, typer.Argument(help="Name of the agent to edit")],
 ) -> None:
     """Edit an agent template in your editor."""
-    import subprocess
+    from rich.console import Console
+
+    from agent_manager.store.agent_store import get_agent_store
+    from agentctl.editor import open_in_editor
 
-    console = Console()
+    console = Console(highlight=False)
     store = get_agent_store()
 
     if not store.exists(name):
@@ -134,11 +144,7 @@ def edit_agent(
 
     agent_file = store.agents_directory / f"{name}.yaml"
 
-    editor = subprocess.run(["which", "code"], capture_output=True, text=True)
-    if editor.returncode == 0:
-        subprocess.run(["code", str(agent_file)])
-    else:
-        subprocess.run(["open", "-e", str(agent_file)])
+    open_in_editor(agent_file)
 
 
 @app.command("delete")
@@ -147,7 +153,11 @@ def delete_agent(
     force: Annotated[bool, typer.Option("--force", "-f", help="Skip confirmation")] = False,
 ) -> None:
     """Delete an agent template."""
-    console = Console()
+    from rich.console import Console
+
+    from agent_manager.store.agent_store import get_agent_store
+
+    console = Console(highlight=False)
     store = get_agent_store()
 
     if not store.exists(name):
@@ -169,7 +179,11 @@ def validate_agent(
     name: Annotated[str, typer.Argument(help="Name of the agent to validate")],
 ) -> None:
     """Validate an agent template YAML."""
-    console = Console()
+    from rich.console import Console
+
+    from agent_manager.store.agent_store import get_agent_store
+
+    console = Console(highlight=False)
     store = get_agent_store()
 
     if not store.exists(name):
@@ -2,14 +2,12 @@
 
 from __future__ import annotations
 
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 import typer
-from rich.console import Console
-from rich.table import Table
-from rich.tree import Tree
 
-from agent_manager.store.workflow_store import get_workflow_store
+if TYPE_CHECKING:
+    from rich.console import Console
 
 app = typer.Typer(help="Manage workflow orchestrations")
 
@@ -17,7 +15,12 @@ app = typer.Typer(help="Manage workflow orchestrations")
 @app.command("list")
 def list_workflows() -> None:
     """List all workflows."""
-    console = Console()
+    from rich.console import Console
+    from rich.table import Table
+
+    from agent_manager.store.workflow_store import get_workflow_store
+
+    console = Console(highlight=False)
     store = get_workflow_store()
 
     workflows = store.list_workflow_names()
@@ -60,7 +63,11 @@ def show_workflow(
     format: Annotated[str, typer.Option("--format", "-f", help="Output format: yaml or tree")] = "yaml",
 ) -> None:
     """Show workflow details."""
-    console = Console()
+    from rich.console import Console
+
+    from agent_manager.store.workflow_store import get_workflow_store
+
+    console = Console(highlight=False)
     store = get_workflow_store()
 
     if not store.exists(name):
@@ -78,6 +85,8 @@ def show_workflow(
 
 def _show_workflow_tree(console: Console, wf) -> None:
     """Show workflow as a dependency tree."""
+    from rich.tree import Tree
+
     tree = Tree(f"[bold cyan]{wf.name}[/bold cyan]")
 
     if wf.description:
@@ -124,9 +133,12 @@ def create_workflow(
     edit: Annotated[bool, typer.Option("--edit", "-e", help="Open in editor after creation")] = False,
 ) -> None:
     """Create a new workflow."""
-    import subprocess
+    from rich.console import Console
+
+    from agent_manager.store.workflow_store import get_workflow_store
+    from agentctl.editor import open_in_editor
 
-    console = Console()
+    console = Console(highlight=False)
     store = get_workflow_store()
 
     if store.exists(name):
@@ -174,11 +186,7 @@ jobs:
     console.print(f"[green]Created workflow:[/green] {workflow_file}")
 
     if edit:
-        editor = subprocess.run(["which", "code"], capture_output=True, text=True)
-        if editor.returncode == 0:
-            subprocess.run(["code", str(workflow_file)])
-        else:
-            subprocess.run(["open", "-e", str(workflow_file)])
+        open_in_editor(workflow_file)
 
 
 @app.command("edit")
@@ -186,9 +194,12 @@ def edit_workflow(
     name: Annotated[str, typer.Argument(help="Name of the workflow to edit")],
 ) -> None:
     """Edit a workflow in your editor."""
-    import subprocess
+    from rich.console import Console
+
+    from agent_manager.store.workflow_store import get_workflow_store
+    from agentctl.editor import open_in_editor
 
-    console = Console()
+    console = Console(highlight=False)
     store = get_workflow_store()
 
     if not store.exists(name):
@@ -197,11 +208,7 @@ def edit_workflow(
 
     workflow_file = store.workflows_directory / f"{name}.yaml"
 
-    editor = subprocess.run(["which", "code"], capture_output=True, text=True)
-    if editor.returncode == 0:
-        subprocess.run(["code", str(workflow_file)])
-    else:
-        subprocess.run(["open", "-e", str(workflow_file)])
+    open_in_editor(workflow_file)
 
 
 @app.command("delete")
@@ -210,7 +217,11 @@ def delete_workflow(
     force: Annotated[bool, typer.Option("--force", "-f", help="Skip confirmation")] = False,
 ) -> None:
     """Delete a workflow."""
-    console = Console()
+    from rich.console import Console
+
+    from agent_manager.store.workflow_store import get_workflow_store
+
+    console = Console(highlight=False)
     store = get_workflow_store()
 
     if not store.exists(name):
@@ -232,7 +243,12 @@ def validate_workflow(
     name: Annotated[str, typer.Argument(help="Name of the workflow to validate")],
 ) -> None:
     """Validate a workflow YAML."""
-    console = Console()
+    from rich.console import Console
+
+    from agent_manager.store.agent_store import get_agent_store
+    from agent_manager.store.workflow_store import get_workflow_store
+
+    console = Console(highlight=False)
     store = get_workflow_store()
 
     if not store.exists(name):
@@ -248,13 +264,13 @@ def validate_workflow(
         order = wf.topological_sort()
         console.print(f"  Execution order: {' -> '.join(order)}")
 
-        # Check for agents
+        # Check for agents, once per distinct agent
+        agent_store = get_agent_store()
+        referenced = {job.agent for job in wf.jobs.values() if job.agent}
+        missing = {agent for agent in referenced if not agent_store.exists(agent)}
         for job_name, job in wf.jobs.items():
-            if job.agent:
-                from agent_manager.store.agent_store import get_agent_store
-                agent_store = get_agent_store()
-                if not agent_store.exists(job.agent):
-                    console.print(f"[yellow]Warning:[/yellow] Job '{job_name}' references missing agent '{job.agent}'")
+            if job.agent in missing:
+                console.print(f"[yellow]Warning:[/yellow] Job '{job_name}' references missing agent '{job.agent}'")
 
     except Exception as e:
         console.print(f"[red]Invalid:[/red] {e}")
@@ -266,7 +282,11 @@ def dry_run_workflow(
     name: Annotated[str, typer.Argument(help="Name of the workflow to dry run")],
 ) -> None:
     """Show what would be executed without running."""
-    console = Console()
+    from rich.console import Console
+
+    from agent_manager.store.workflow_store import get_workflow_store
+
+    console = Console(highlight=False)
     store = get_workflow_store()
 
     if not store.exists(name):
@@ -0,0 +1,20 @@
+"""Opening agent and workflow files in the user's editor."""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+from functools import cache
+from pathlib import Path
+
+
+@cache
+def _editor_command() -> tuple[str, ...]:
+    """Command prefix for opening a file: VS Code if it's on PATH, else TextEdit."""
+    code = shutil.which("code")
+    return (code,) if code else ("open", "-e")
+
+
+def open_in_editor(path: Path) -> None:
+    """Open a file in the editor and wait for the launcher to return."""
+    subprocess.run([*_editor_command(), str(path)])
@@ -0,0 +1,241 @@
+"""Tests for running several goals-based jobs in one provider call."""
+
+from __future__ import annotations
+
+import json
+import re
+from pathlib import Path
+
+import pytest
+
+from agent_manager.execution import job_runner as job_runner_module
+from agent_manager.execution.job_runner import JobRunner, _split_batch_response
+from agent_manager.execution.workflow_runner import WorkflowRunner
+from agent_manager.expressions.evaluator import ExpressionContext
+from agent_manager.models.result import JobStatus
+from agent_manager.models.workflow import Job, Workflow, WorkflowDefaults, WorkflowTriggers
+from agent_manager.providers.base import LLMProvider, LLMResponse, ProviderConfig
+from agent_manager.store.workflow_store import WorkflowStore
+from agentctl import _job_log_file
+
+
+class _FakeProvider(LLMProvider):
+    """Provider that answers each task in a batched prompt with a canned reply."""
+
+    def __init__(self, replies: dict[str, str], outputs_json: dict[str, dict] | None = None):
+        self.replies = replies
+        self.outputs_json = outputs_json or {}
+        self.prompts: list[str] = []
+
+    @property
+    def name(self) -> str:
+        return "fake"
+
+    async def execute(
+        self,
+        prompt: str,
+        config: ProviderConfig,
+        log_file: Path | None = None,
+        session_id: str | None = None,
+    ) -> LLMResponse:
+        self.prompts.append(prompt)
+        if log_file:
+            log_file.write_text("provider log\n")
+
+        tasks = re.findall(r"^# Task (\d+): (\S+)$", prompt, re.MULTILINE)
+        if not tasks:
+            tasks = [("1", name) for name in self.replies]
+        reply = "".join(
+            f"# Task {i}: {name}\n\n{self.replies[name]}\n---\n\n" for i, name in tasks
+        )
+        for name, data in self.outputs_json.items():
+            output_file = re.search(rf"`([^`]*/{name}/outputs\.json)`", prompt)
+            assert output_file is not None
+            Path(output_file.group(1)).write_text(json.dumps(data))
+
+        return LLMResponse(
+            success=True, result=reply, input_tokens=11, output_tokens=5, cost=0.3
+        )
+
+    def execute_sync(
+        self,
+        prompt: str,
+        config: ProviderConfig,
+        log_file: Path | None = None,
+        session_id: str | None = None,
+    ) -> LLMResponse:
+        raise NotImplementedError
+
+
+@pytest.fixture(autouse=True)
+def scratch_base(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep scratch directories inside the test's temporary directory."""
+    scratch = tmp_path / "scratch"
+    monkeypatch.setattr(job_runner_module, "_SCRATCH_BASE", scratch)
+    return scratch
+
+
+def _workflow(tmp_path: Path, names: list[str], batch_size: int | None = 4) -> Workflow:
+    """Build a workflow of independent goals-based jobs, each reporting a summary."""
+    return Workflow(
+        name="batched",
+        on=WorkflowTriggers(manual=True),
+        defaults=WorkflowDefaults(working_directory=str(tmp_path), batch_size=batch_size),
+        jobs={name: Job(goals=[f"Do {name}"], report=["summary"]) for name in names},
+    )
+
+
+class TestSplitBatchResponse:
+    """Tests for splitting a batched reply into per-job sections."""
+
+    def test_split_by_task_headers(self) -> None:
+        """Test that each job gets only the text under its own header."""
+        response = (
+            "Working through both.\n\n"
+            "# Task 1: lint\n\nsummary: clean\n---\n\n"
+            "## Task 2: test\n\nsummary: 2 failures\n---\n"
+        )
+        assert _split_batch_response(response, ["lint", "test"]) == [
+            "summary: clean",
+            "summary: 2 failures",
+        ]
+
+    def test_missing_section_is_empty(self) -> None:
+        """Test that a job whose header is missing gets nothing from the other tasks."""
+        response = "# Task 2: test\n\nsummary: 2 failures\n"
+        assert _split_batch_response(response, ["lint", "test"]) == ["", "summary: 2 failures"]
+        assert _split_batch_response("summary: clean", ["lint", "test"]) == ["", ""]
+
+    def test_duplicated_section_is_joined(self) -> None:
+        """Test that a repeated header adds to its own job, not the one before it."""
+        response = (
+            "# Task 1: lint\n\nsummary: clean\n\n"
+            "# Task 2: test\n\nsummary: 2 failures\n\n"
+            "# Task 1: lint\n\nAlso fixed a typo.\n"
+        )
+        assert _split_batch_response(response, ["lint", "test"]) == [
+            "summary: clean\n\nAlso fixed a typo.",
+            "summary: 2 failures",
+        ]
+
+    def test_other_headings_stay_in_section(self) -> None:
+        """Test that headings that aren't task headers don't end a section."""
+        response = (
+            "# Task 1: lint\n\n## Details\nsummary: clean\n"
+            "# Task 3: lint\n# Task 2: other\n"
+        )
+        assert _split_batch_response(response, ["lint", "test"]) == [
+            "## Details\nsummary: clean\n# Task 3: lint\n# Task 2: other",
+            "",
+        ]
+
+
+class TestRunBatch:
+    """Tests for JobRunner.run_batch."""
+
+    async def test_results_keep_their_own_reply(self, tmp_path: Path) -> None:
+        """Test that outputs and claude_output come from each job's own section."""
+        provider = _FakeProvider({"lint": "summary: clean", "test": "All tests passed."})
+        workflow = _workflow(tmp_path, ["lint", "test"])
+        runner = JobRunner(provider=provider)
+
+        results = await runner.run_batch(
+            jobs=list(workflow.jobs.items()),
+            workflow=workflow,
+            context=ExpressionContext(),
+            log_directory=tmp_path / "logs",
+            run_id="run1",
+        )
+
+        assert len(provider.prompts) == 1
+        lint, test = results
+        assert lint.status == test.status == JobStatus.COMPLETED
+        assert lint.claude_output == "summary: clean"
+        assert lint.outputs == {"summary": "clean"}
+        # The other task's "summary:" line must not fill this job's output
+        assert test.claude_output == "All tests passed."
+        assert test.outputs == {}
+
+    async def test_outputs_file_is_read_per_job(self, tmp_path: Path) -> None:
+        """Test that each job's outputs.json is preferred over its reply."""
+        provider = _FakeProvider(
+            {"lint": "summary: from reply", "test": "summary: from reply"},
+            outputs_json={"test": {"summary": "from file"}},
+        )
+        workflow = _workflow(tmp_path, ["lint", "test"])
+
+        lint, test = await JobRunner(provider=provider).run_batch(
+            jobs=list(workflow.jobs.items()),
+            workflow=workflow,
+            context=ExpressionContext(),
+            log_directory=tmp_path / "logs",
+            run_id="run1",
+        )
+
+        assert lint.outputs == {"summary": "from reply"}
+        assert test.outputs == {"summary": "from file"}
+
+    async def test_log_file_and_stats_are_shared(self, tmp_path: Path) -> None:
+        """Test that every job points at the batch's log and stats add up to the call's."""
+        provider = _FakeProvider({name: "done" for name in ("a", "b", "c")})
+        workflow = _workflow(tmp_path, ["a", "b", "c"])
+
+        results = await JobRunner(provider=provider).run_batch(
+            jobs=list(workflow.jobs.items()),
+            workflow=workflow,
+            context=ExpressionContext(),
+            log_directory=tmp_path / "logs",
+        )
+
+        log_file = tmp_path / "logs" / "a.batch.log"
+        assert log_file.read_text() == "provider log\n"
+        assert {result.log_file for result in results} == {str(log_file)}
+        assert sum(result.input_tokens or 0 for result in results) == 11
+        assert sum(result.output_tokens or 0 for result in results) == 5
+        assert sum(result.cost or 0 for result in results) == pytest.approx(0.3)
+        assert all(result.start_time == results[0].start_time for result in results)
+
+
+class TestBatchedWorkflowRun:
+    """Tests for how WorkflowRunner records batched jobs."""
+
+    async def test_batched_results_are_recorded(self, tmp_path: Path) -> None:
+        """Test that a batched run records and saves one result per job."""
+        provider = _FakeProvider({"lint": "summary: clean", "test": "summary: 2 failures"})
+        store = WorkflowStore(tmp_path / "store")
+        runner = WorkflowRunner(store=store, job_runner=JobRunner(provider=provider))
+        statuses: list[tuple[str, JobStatus]] = []
+
+        run = await runner.run(
+            _workflow(tmp_path, ["lint", "test"]),
+            status_callback=lambda name, status: statuses.append((name, status)),
+        )
+
+        assert len(provider.prompts) == 1
+        assert run.status.value == "completed"
+        for name in ("lint", "test"):
+            job_statuses = [status for job_name, status in statuses if job_name == name]
+            assert job_statuses == [JobStatus.RUNNING, JobStatus.COMPLETED]
+
+        saved = store.load_run("batched", run.id)
+        log_dir = store.run_log_directory("batched", run.id)
+        assert saved.job_results["lint"].outputs == {"summary": "clean"}
+        assert saved.job_results["test"].outputs == {"summary": "2 failures"}
+        for name, result in saved.job_results.items():
+            # `agentctl logs` finds the shared log through the recorded path
+            log_file = _job_log_file(log_dir, name, result.log_file)
+            assert log_file == log_dir / "lint.batch.log"
+            assert log_file.exists()
+
+    async def test_without_batch_size_jobs_run_alone(self, tmp_path: Path) -> None:
+        """Test that jobs only share a call when batching is enabled."""
+        provider = _FakeProvider({"lint": "summary: clean", "test": "summary: 2 failures"})
+        store = WorkflowStore(tmp_path / "store")
+        runner = WorkflowRunner(store=store, job_runner=JobRunner(provider=provider))
+
+        run = await runner.run(_workflow(tmp_path, ["lint", "test"], batch_size=None))
+
+        assert len(provider.prompts) == 2
+        log_dir = store.run_log_directory("batched", run.id)
+        for name, result in run.job_results.items():
+            assert result.log_file == str(log_dir / f"{name}.log")
@@ -0,0 +1,89 @@
+"""Tests for extracting declared outputs from responses."""
+
+from __future__ import annotations
+
+import importlib
+import re
+import sys
+from collections.abc import Iterator
+from types import ModuleType
+
+import pytest
+
+from agent_manager.expressions import extractor as extractor_module
+
+# Whitespace that Python's re treats as \s but RE2's ASCII-only \s doesn't
+_UNICODE_SPACES = ["\xa0", "\u2003", "\u3000", "\v"]
+
+
+@pytest.fixture(params=["re", "re2"])
+def extractor(
+    request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[ModuleType]:
+    """The extractor module, reloaded to use the requested regex engine."""
+    if request.param == "re2":
+        pytest.importorskip("re2")
+    else:
+        # A None entry makes `import re2` raise ImportError
+        monkeypatch.setitem(sys.modules, "re2", None)
+
+    module = importlib.reload(extractor_module)
+    assert module._regex.__name__ == request.param
+    yield module
+
+    monkeypatch.undo()
+    importlib.reload(extractor_module)
+
+
+@pytest.mark.parametrize(
+    ("response", "expected"),
+    [
+        ('<output name="summary">All good</output>', "All good"),
+        ("<output  name = 'summary' >\nAll good\n</output>", "All good"),
+        ("<summary>All good</summary>", "All good"),
+        ("**Summary**: All good\nMore text", "All good"),
+        ("Notes\nsummary: All good\n", "All good"),
+        ("- summary : All good", "All good"),
+        ("• summary: All good", "All good"),
+        ("Overall, the summary is All good.", "All good"),
+        ("summary = `All good`", "All good"),
+        # Key-value matches before the inline backtick form
+        ("summary: `All good`", "`All good`"),
+        ("No outputs here", None),
+    ],
+)
+def test_extract_formats(extractor: ModuleType, response: str, expected: str | None) -> None:
+    """Test each supported output format under both regex engines."""
+    outputs = extractor.OutputExtractor().extract(response, ["summary"])
+    assert outputs.get("summary") == expected
+
+
+@pytest.mark.parametrize("space", _UNICODE_SPACES)
+@pytest.mark.parametrize(
+    "template",
+    [
+        "<output{s}name{s}={s}'summary'{s}>All good</output>",
+        "**summary**{s}:{s}All good",
+        "summary{s}:{s}All good",
+        "-{s}summary{s}:{s}All good",
+        "the{s}summary{s}is{s}All good.",
+        "summary{s}={s}All good.",
+    ],
+)
+def test_unicode_whitespace(extractor: ModuleType, template: str, space: str) -> None:
+    """Test that non-ASCII whitespace between tokens matches the same under both engines."""
+    response = template.format(s=space)
+    outputs = extractor.OutputExtractor().extract(response, ["summary"])
+    assert outputs == {"summary": "All good"}
+
+
+def test_json_block_after_unicode_whitespace(extractor: ModuleType) -> None:
+    """Test that a fenced JSON block is found after non-ASCII whitespace."""
+    response = 'Done.\n```json \n{"outputs": {"summary": "All good"}}\n```'
+    assert extractor.OutputExtractor().extract_from_json(response) == {"summary": "All good"}
+
+
+def test_whitespace_class_matches_re() -> None:
+    """Test that the spelled-out whitespace class is exactly what re's \\s matches."""
+    text = "".join(chr(c) for c in range(sys.maxunicode + 1) if not 0xD800 <= c < 0xE000)
+    assert set(re.findall(extractor_module._WS, text)) == set(re.findall(r"\s", text))
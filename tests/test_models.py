@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import pytest
 
+from agent_manager.models.agent import Agent, TriggerType
 from agent_manager.models.workflow import (
     Job,
     ScheduleConfig,
@@ -42,6 +43,20 @@ class TestWorkflow:
         )
         assert wf.topological_sort() == ["first", "second"]
 
+    def test_workflow_critical_path_lengths(self) -> None:
+        """Test longest dependency chain lengths used to prioritize jobs."""
+        wf = Workflow(
+            name="test",
+            on=WorkflowTriggers(manual=True),
+            jobs={
+                "build": Job(prompt="Build"),
+                "test": Job(prompt="Test", needs=["build"]),
+                "deploy": Job(prompt="Deploy", needs=["test", "build"]),
+                "lint": Job(prompt="Lint"),
+            },
+        )
+        assert wf.critical_path_lengths() == {"build": 3, "test": 2, "deploy": 1, "lint": 1}
+
     def test_workflow_cycle_detection(self) -> None:
         """Test that circular dependencies are detected."""
         with pytest.raises(ValueError, match="Circular dependency"):
@@ -54,6 +69,18 @@ class TestWorkflow:
                 },
             )
 
+    def test_workflow_deep_dependency_chain(self) -> None:
+        """Test that long dependency chains don't hit the recursion limit."""
+        names = [f"job{i:04d}" for i in range(3000)]
+        jobs = {name: Job(prompt=name, needs=[dep]) for name, dep in zip(names, names[1:])}
+        jobs[names[-1]] = Job(prompt=names[-1])
+        wf = Workflow(name="test", on=WorkflowTriggers(manual=True), jobs=jobs)
+        assert wf.topological_sort() == names[::-1]
+
+        jobs[names[-1]] = Job(prompt=names[-1], needs=[names[0]])
+        with pytest.raises(ValueError, match="Circular dependency"):
+            Workflow(name="test", on=WorkflowTriggers(manual=True), jobs=jobs)
+
     def test_workflow_missing_dependency(self) -> None:
         """Test that missing dependencies are detected."""
         with pytest.raises(ValueError, match="unknown job"):
@@ -104,6 +131,41 @@ jobs:
         assert wf.name == "test"
         assert wf.on.is_manual_enabled
 
+    def test_workflow_batch_size(self) -> None:
+        """Test batch_size defaults and config-based job grouping."""
+        wf = Workflow(
+            name="test",
+            on=WorkflowTriggers(manual=True),
+            jobs={
+                "a": Job(goals=["A"]),
+                "b": Job(goals=["B"]),
+                "c": Job(goals=["C"], model="opus"),
+            },
+        )
+        assert wf.batch_size is None
+
+        wf.defaults = WorkflowDefaults(batch_size=4)
+        assert wf.batch_size == 4
+        assert wf.resolve_job_config("a") == wf.resolve_job_config("b")
+        assert wf.resolve_job_config("a") != wf.resolve_job_config("c")
+        assert len({wf.resolve_job_config(name) for name in wf.jobs}) == 2
+
+
+class TestAgent:
+    """Tests for Agent model."""
+
+    def test_agent_yaml_roundtrip(self) -> None:
+        """Test that enum fields survive YAML serialization."""
+        original = Agent.template("demo")
+
+        yaml_str = original.to_yaml()
+        restored = Agent.from_yaml(yaml_str)
+
+        assert "!!python" not in yaml_str
+        assert restored.trigger is not None
+        assert restored.trigger.type == TriggerType.MANUAL
+        assert restored == original
+
 
 class TestJobResult:
     """Tests for JobResult model."""
@@ -144,6 +206,7 @@ class TestWorkflowRun:
 
         assert run.workflow_name == "test"
         assert run.status == WorkflowStatus.PENDING
+        assert not run.is_finished
         assert len(run.job_results) == 2
         assert "a" in run.job_results
         assert "b" in run.job_results
@@ -168,3 +231,21 @@ class TestWorkflowRun:
 
         assert run.completed_job_count == 1
         assert run.failed_job_count == 1
+
+    def test_workflow_run_totals_track_in_place_updates(self) -> None:
+        """Test totals follow job results edited in place until the run finishes."""
+        run = WorkflowRun.create(workflow_name="test", job_names=["a", "b"])
+        run.mark_started()
+
+        run.job_results["a"].update_stats(input_tokens=10, output_tokens=5, cost=0.5)
+        assert run.total_tokens == 15
+        run.job_results["b"].update_stats(input_tokens=1, output_tokens=1, cost=0.25)
+        assert run.total_tokens == 17
+        assert run.total_cost == 0.75
+
+        run.mark_completed()
+        assert run.total_tokens == 17
+
+        run.update_job_result(JobResult(job_name="b", input_tokens=2, output_tokens=2))
+        assert run.total_tokens == 19
+        assert run.total_cost == 0.5
@@ -1,7 +1,9 @@
 """Tests for scheduling infrastructure."""
 
+import subprocess
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from unittest.mock import patch
 
 import pytest
 
@@ -78,3 +80,22 @@ class TestLaunchAgentManager:
             manager = LaunchAgentManager(launch_agents_dir=Path(tmpdir))
 
             assert manager.list_enabled() == []
+
+    def test_enabled_workflows_single_launchctl_call(self):
+        """Test batch enabled check matches per-workflow plist and label checks."""
+        with TemporaryDirectory() as tmpdir:
+            manager = LaunchAgentManager(launch_agents_dir=Path(tmpdir))
+            for name in ("loaded", "unloaded"):
+                manager.plist_path(name).write_text("")
+
+            listing = (
+                "PID\tStatus\tLabel\n"
+                f"-\t0\t{manager.label('loaded')}\n"
+                f"-\t0\t{manager.label('no-plist')}\n"
+            )
+            completed = subprocess.CompletedProcess([], 0, stdout=listing, stderr="")
+            with patch("subprocess.run", return_value=completed) as run:
+                enabled = manager.enabled_workflows(["loaded", "unloaded", "no-plist"])
+
+            assert enabled == {"loaded"}
+            run.assert_called_once()
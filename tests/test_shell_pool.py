@@ -0,0 +1,94 @@
+"""Tests for the pool of shells that runs context commands."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from agent_manager.execution.shell_pool import ShellPool
+
+
+def _is_alive(pid: int) -> bool:
+    """Check if a process exists and isn't a zombie waiting to be reaped."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            return f.read().rpartition(")")[2].split()[0] != "Z"
+    except OSError:
+        return True
+
+
+class TestShellPool:
+    """Tests for ShellPool."""
+
+    @pytest.mark.parametrize("command", ['echo "unterminated', "cat <<EOF\nhello"])
+    async def test_malformed_command_returns_promptly(self, tmp_path: Path, command: str) -> None:
+        """Test that an unterminated quote or heredoc can't swallow the sentinel."""
+        pool = ShellPool()
+        try:
+            await asyncio.wait_for(pool.run(command, tmp_path, 1000), 5)
+            output, truncated = await asyncio.wait_for(pool.run("echo ok", tmp_path, 1000), 5)
+            assert output == b"ok\n"
+            assert not truncated
+        finally:
+            await pool.close()
+
+    async def test_timeout_kills_process_group(self, tmp_path: Path) -> None:
+        """Test that a cancelled command is killed along with everything it started."""
+        pool = ShellPool()
+        pid_file = tmp_path / "pid"
+        try:
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(
+                    pool.run(f"sleep 30 & echo $! > {pid_file}; wait", tmp_path, 1000), 1
+                )
+        finally:
+            await pool.close()
+
+        pid = int(pid_file.read_text())
+        deadline = time.monotonic() + 5
+        while _is_alive(pid) and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert not _is_alive(pid)
+        assert not pool._idle.get(tmp_path)
+
+    async def test_state_does_not_leak_between_commands(self, tmp_path: Path) -> None:
+        """Test that cd and export in one command don't affect the next."""
+        pool = ShellPool(max_idle_per_directory=1)
+        try:
+            await pool.run("cd / && export AGENT_MANAGER_TEST=leaked", tmp_path, 1000)
+            output, _ = await pool.run(
+                'pwd; echo "${AGENT_MANAGER_TEST:-unset}"', tmp_path, 1000
+            )
+            assert output.decode().split() == [str(tmp_path.resolve()), "unset"]
+        finally:
+            await pool.close()
+
+    async def test_oversized_output_is_truncated(self, tmp_path: Path) -> None:
+        """Test that runaway output is cut off and its shell isn't reused."""
+        pool = ShellPool()
+        try:
+            output, truncated = await asyncio.wait_for(pool.run("yes", tmp_path, 1000), 5)
+            assert truncated
+            assert len(output) == 1000
+            assert not pool._idle.get(tmp_path)
+        finally:
+            await pool.close()
+
+    async def test_close_waits_for_shells_beyond_the_idle_limit(self, tmp_path: Path) -> None:
+        """Test that shells turned away by a full pool are still awaited on close."""
+        pool = ShellPool(max_idle_per_directory=1)
+        await asyncio.gather(*(pool.run("sleep 0.1", tmp_path, 1000) for _ in range(3)))
+        retired = list(pool._retired)
+        assert retired
+
+        await pool.close()
+        assert all(proc.returncode is not None for proc in retired)
+        assert not pool._retired
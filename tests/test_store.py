@@ -0,0 +1,57 @@
+"""Tests for the workflow store."""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+from agent_manager.models.workflow import Job, Workflow, WorkflowTriggers
+from agent_manager.store.workflow_store import WorkflowStore
+
+
+def _rewrite_in_place(path: Path, old: str, new: str) -> None:
+    """Replace text in a file, keeping its size and mtime as they were."""
+    stat = path.stat()
+    content = path.read_text()
+    assert len(old) == len(new) and old in content
+    path.write_text(content.replace(old, new))
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+
+class TestWorkflowStore:
+    """Tests for WorkflowStore."""
+
+    def _save_workflow(self, store: WorkflowStore) -> Path:
+        """Save a small workflow and return its file."""
+        store.save(
+            Workflow(
+                name="test",
+                description="AAAA",
+                on=WorkflowTriggers(manual=True),
+                jobs={"main": Job(prompt="Do something")},
+            )
+        )
+        return store.workflow_path("test")
+
+    def test_load_sees_same_size_rewrite_of_recent_file(self, tmp_path: Path) -> None:
+        """Test that a rewrite within one timestamp tick isn't hidden by the cache."""
+        store = WorkflowStore(tmp_path)
+        path = self._save_workflow(store)
+        assert store.load("test").description == "AAAA"
+
+        _rewrite_in_place(path, "AAAA", "BBBB")
+        assert store.load("test").description == "BBBB"
+
+    def test_load_caches_settled_file(self, tmp_path: Path) -> None:
+        """Test that files whose mtime is old enough to trust are served from the cache."""
+        store = WorkflowStore(tmp_path)
+        path = self._save_workflow(store)
+        an_hour_ago = time.time_ns() - 3600 * 10**9
+        os.utime(path, ns=(an_hour_ago, an_hour_ago))
+
+        first = store.load("test")
+        second = store.load("test")
+        assert first == second
+        assert first is not second
+        assert "test" in store._workflow_cache